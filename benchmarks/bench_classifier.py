@@ -0,0 +1,86 @@
+from pathlib import Path
+import random
+import sys
+import timeit
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from folder_organizer import DEFAULT_EXTENSION_TO_TYPE, SuffixClassifier
+
+NAME_COUNT = 100_000
+REPEAT = 5
+
+
+def make_names(count: int) -> list[str]:
+    """
+    Generate a reproducible list of file names with a realistic mix of extensions.
+
+    Args:
+        count (int): Number of names to generate.
+
+    Returns:
+        list[str]: The file names.
+    """
+    rng = random.Random(42)
+    extensions = [ext for ext in DEFAULT_EXTENSION_TO_TYPE if ext != "others"]
+    extensions += [".tar.gz", ".unknown", ".JPG", ".PDF", ""]
+    return [f"file_{i}{rng.choice(extensions)}" for i in range(count)]
+
+
+class PathSuffixClassifier:
+    """
+    The original classification: Path.suffix lowercased and looked up in a dict.
+    """
+
+    def __init__(self, file_type_dict: dict[str, str]):
+        self.file_type_dict = file_type_dict
+
+    def classify(self, file_name: str) -> str | None:
+        return self.file_type_dict.get(Path(file_name).suffix.lower())
+
+
+class LastDotClassifier:
+    """
+    The single-dot dict lookup that SuffixClassifier replaced.
+    """
+
+    def __init__(self, file_type_dict: dict[str, str]):
+        self.file_type_dict = file_type_dict
+
+    def classify(self, file_name: str) -> str | None:
+        dot_index = file_name.rfind(".")
+        if 0 < dot_index < len(file_name) - 1:
+            return self.file_type_dict.get(file_name[dot_index:].lower())
+        return None
+
+
+def classify_all(classifier, names: list[str]) -> None:
+    """
+    Classify every name with the given classifier.
+    """
+    classify = classifier.classify
+    for name in names:
+        classify(name)
+
+
+def main():
+    """Run the classification microbenchmark and print the best time of each approach."""
+    names = make_names(NAME_COUNT)
+    file_type_dict = dict(DEFAULT_EXTENSION_TO_TYPE)
+    multi_dot_dict = dict(file_type_dict, **{".tar.gz": "Compactado"})
+
+    cases = {
+        "Path.suffix + dict": PathSuffixClassifier(file_type_dict),
+        "last dot + dict": LastDotClassifier(file_type_dict),
+        "SuffixClassifier (single-dot)": SuffixClassifier(file_type_dict),
+        "SuffixClassifier (with .tar.gz)": SuffixClassifier(multi_dot_dict),
+    }
+
+    print(f"{NAME_COUNT} names, best of {REPEAT} runs")
+    for label, classifier in cases.items():
+        best = min(timeit.repeat(lambda: classify_all(classifier, names), number=1, repeat=REPEAT))
+        print(f"{label:<34} {best * 1000:8.1f} ms  {NAME_COUNT / best:12,.0f} names/s")
+
+
+if __name__ == "__main__":
+    main()
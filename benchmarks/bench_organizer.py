@@ -0,0 +1,321 @@
+from pathlib import Path
+import argparse
+import builtins
+import json
+import os
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from folder_organizer import DEFAULT_EXTENSION_TO_TYPE, FileOrganizer
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+SCENARIOS = ("mixed", "collisions", "repeated", "unmapped")
+BASELINES_PATH = Path(__file__).parent / "baselines.json"
+REGRESSION_THRESHOLD = 0.10
+SEED = 42
+
+# os functions that map to one system call each; counted while a run is traced
+SYSCALL_FUNCTIONS = (
+    "scandir", "listdir", "stat", "lstat", "open", "close", "rename", "replace",
+    "mkdir", "rmdir", "unlink", "fsync", "copy_file_range", "sendfile",
+)
+
+# the names of the "repeated" scenario, each copied into every source subfolder
+REPEATED_NAMES = ("report.pdf", "IMG_0001.jpg", "notes.txt", "invoice.PDF", "track01.mp3", "backup.tar.gz", "data.csv", "setup.exe")
+# numbered copies of each repeated name already in its destination folder, as name(1) to name(N)
+COLLISION_CHAIN_DEPTH = 1000
+
+# relative weights of the extensions in the "mixed" scenario, roughly those of a downloads folder
+EXTENSION_WEIGHTS = {
+    ".jpg": 20, ".png": 12, ".pdf": 12, ".mp4": 6, ".mp3": 6, ".zip": 6, ".docx": 5,
+    ".txt": 5, ".xlsx": 4, ".exe": 3, ".JPG": 3, ".PDF": 2, ".tar.gz": 2, ".gif": 2,
+    ".csv": 2, ".pptx": 2, ".json": 2, ".iso": 1, ".webp": 1, ".svg": 1, "": 1,
+}
+
+
+class SyscallCounter:
+    """
+    Counts calls to the os functions listed in SYSCALL_FUNCTIONS, and to builtins.open.
+
+    The functions are replaced by counting wrappers while the counter is active. The
+    stat done by DirEntry methods is not seen, so the count is a lower bound.
+
+    Attributes:
+        counts (dict[str, int]): Number of calls by function name.
+    """
+
+    def __init__(self):
+        self.counts: dict[str, int] = {}
+        self._originals: list[tuple[object, str, object]] = []
+
+    def _wrap(self, module: object, name: str, label: str) -> None:
+        original = getattr(module, name, None)
+        if original is None:
+            return
+        counts = self.counts
+
+        def counting(*args, **kwargs):
+            counts[label] = counts.get(label, 0) + 1
+            return original(*args, **kwargs)
+
+        self._originals.append((module, name, original))
+        setattr(module, name, counting)
+
+    def __enter__(self) -> "SyscallCounter":
+        for name in SYSCALL_FUNCTIONS:
+            self._wrap(os, name, name)
+        self._wrap(builtins, "open", "open")
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for module, name, original in reversed(self._originals):
+            setattr(module, name, original)
+        self._originals.clear()
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+
+def make_names(count: int, scenario: str, rng: random.Random) -> list[str]:
+    """
+    Generate a reproducible list of file names for a scenario.
+
+    Args:
+        count (int): Number of names to generate.
+        scenario (str): One of SCENARIOS.
+        rng (random.Random): The seeded generator.
+
+    Returns:
+        list[str]: The file names. In the "repeated" scenario, REPEATED_NAMES over and over.
+    """
+    if scenario == "repeated":
+        return [REPEATED_NAMES[i % len(REPEATED_NAMES)] for i in range(count)]
+
+    extensions = list(EXTENSION_WEIGHTS)
+    weights = list(EXTENSION_WEIGHTS.values())
+    chosen = rng.choices(extensions, weights, k=count)
+
+    if scenario == "unmapped":
+        # half of the files have extensions missing from the mapping
+        unknown = [f".x{i:03d}" for i in range(200)]
+        chosen = [rng.choice(unknown) if i % 2 else extension for i, extension in enumerate(chosen)]
+
+    return [f"file_{i:07d}{extension}" for i, extension in enumerate(chosen)]
+
+
+def create_files(directory: Path, names: list[str]) -> None:
+    """
+    Create empty files with the given names.
+
+    Args:
+        directory (Path): The directory where the files are created.
+        names (list[str]): The file names.
+    """
+    flags = os.O_CREAT | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    for name in names:
+        os.close(os.open(os.path.join(directory, name), flags))
+
+
+def generate_directory(root: Path, count: int, scenario: str) -> Path:
+    """
+    Generate a reproducible synthetic directory for a scenario.
+
+    In the "collisions" scenario, every destination folder already holds a file with
+    the name of each file that will be moved into it, so every move needs a new name.
+    In the "repeated" scenario, the few REPEATED_NAMES are spread over subfolders (one
+    copy of each per subfolder, to be organized recursively), and their destination
+    folders already hold each name with a chain of COLLISION_CHAIN_DEPTH numbered copies.
+
+    Args:
+        root (Path): The directory where the synthetic directory is created.
+        count (int): Number of files to organize.
+        scenario (str): One of SCENARIOS.
+
+    Returns:
+        Path: The synthetic directory.
+    """
+    directory = root / f"{scenario}_{count}"
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.mkdir(parents=True)
+
+    rng = random.Random(f"{SEED}:{scenario}:{count}")
+    names = make_names(count, scenario, rng)
+    if scenario == "repeated":
+        per_folder = len(REPEATED_NAMES)
+        for start in range(0, count, per_folder):
+            folder = directory / f"src_{start // per_folder:06d}"
+            folder.mkdir()
+            create_files(folder, names[start:start + per_folder])
+        existing = []
+        for name in REPEATED_NAMES:
+            stem, dot, suffix = name.rpartition(".")
+            existing.append(name)
+            existing.extend(f"{stem}({counter}){dot}{suffix}" for counter in range(1, COLLISION_CHAIN_DEPTH + 1))
+    else:
+        create_files(directory, names)
+        existing = names
+
+    if scenario in ("collisions", "repeated"):
+        classifier = FileOrganizer().classifier
+        others = DEFAULT_EXTENSION_TO_TYPE["others"]
+        by_type: dict[str, list[str]] = {}
+        for name in existing:
+            by_type.setdefault(classifier.classify(name) or others, []).append(name)
+        for file_type, type_names in by_type.items():
+            folder = directory / file_type
+            folder.mkdir()
+            create_files(folder, type_names)
+
+    return directory
+
+
+def run_case(root: Path, count: int, scenario: str, workers: int) -> dict[str, float]:
+    """
+    Organize a freshly generated directory twice: once timed, once traced.
+
+    The timed run has no instrumentation. The traced run counts system calls and
+    measures the peak memory with tracemalloc, which slows it down too much to be timed.
+
+    Args:
+        root (Path): The directory where the synthetic directories are created.
+        count (int): Number of files.
+        scenario (str): One of SCENARIOS.
+        workers (int): Number of worker threads of the organizer.
+
+    Returns:
+        dict[str, float]: files_per_sec, seconds, syscalls_per_file and peak_memory_mb.
+    """
+    directory = generate_directory(root, count, scenario)
+    organizer = FileOrganizer(workers=workers, recursive=scenario == "repeated")
+    start = time.perf_counter()
+    success, errors = organizer.organize_folder(str(directory))
+    seconds = time.perf_counter() - start
+    if not success or errors:
+        raise RuntimeError(f"{scenario}/{count}: {errors if not success else errors.samples[:3]}")
+
+    directory = generate_directory(root, count, scenario)
+    organizer = FileOrganizer(workers=workers, recursive=scenario == "repeated")
+    tracemalloc.start()
+    try:
+        with SyscallCounter() as counter:
+            organizer.organize_folder(str(directory))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    shutil.rmtree(directory)
+
+    return {
+        "files_per_sec": round(count / seconds, 1),
+        "seconds": round(seconds, 4),
+        "syscalls_per_file": round(counter.total / count, 2),
+        "peak_memory_mb": round(peak / 1024 ** 2, 2),
+    }
+
+
+def get_locations(disk_dir: str | None) -> dict[str, Path]:
+    """
+    Get the roots where the synthetic directories are created.
+
+    Returns:
+        dict[str, Path]: "tmpfs" (/dev/shm, when available) and "disk".
+    """
+    locations = {}
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        locations["tmpfs"] = Path("/dev/shm")
+    locations["disk"] = Path(disk_dir or tempfile.gettempdir())
+    return locations
+
+
+def load_baselines() -> dict:
+    try:
+        with open(BASELINES_PATH, "r", encoding="utf-8") as baselines_file:
+            return json.load(baselines_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_baselines(baselines: dict) -> None:
+    with open(BASELINES_PATH, "w", encoding="utf-8") as baselines_file:
+        json.dump(baselines, baselines_file, indent=2, sort_keys=True)
+        baselines_file.write("\n")
+
+
+def compare(result: dict[str, float], baseline: dict[str, float]) -> tuple[str, bool]:
+    """
+    Compare a result with its baseline.
+
+    Returns:
+        tuple[str, bool]: The change of each metric, and whether files/sec regressed by
+            more than REGRESSION_THRESHOLD.
+    """
+    changes = []
+    for metric in ("files_per_sec", "syscalls_per_file", "peak_memory_mb"):
+        if baseline.get(metric):
+            changes.append(f"{metric} {(result[metric] / baseline[metric] - 1) * 100:+.1f}%")
+    regressed = result["files_per_sec"] < baseline["files_per_sec"] * (1 - REGRESSION_THRESHOLD)
+    return ", ".join(changes), regressed
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark FileOrganizer.organize_folder on synthetic directories.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Number of files of each directory.")
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument("--locations", nargs="+", choices=("tmpfs", "disk"), default=("tmpfs", "disk"))
+    parser.add_argument("--disk-dir", help="Directory on disk for the synthetic directories. Defaults to the temp directory.")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--save", action="store_true", help=f"Store the results as the new baselines in {BASELINES_PATH.name}.")
+    parser.add_argument("--compare", action="store_true", help="Compare the results with the stored baselines; exit with 1 on a regression.")
+    return parser.parse_args()
+
+
+def main():
+    """Run the benchmark matrix, print the results and optionally save or compare baselines."""
+    args = parse_args()
+    locations = {name: path for name, path in get_locations(args.disk_dir).items() if name in args.locations}
+    baselines = load_baselines()
+    results = baselines.setdefault("results", {})
+    regressions = []
+
+    print(f"Python {platform.python_version()}, {platform.system()}, workers={args.workers}")
+    print(f"{'case':<32} {'files/s':>12} {'syscalls/file':>14} {'peak MB':>9}")
+    for location, path in locations.items():
+        root = Path(tempfile.mkdtemp(prefix="categoriza_bench_", dir=path))
+        try:
+            for scenario in args.scenarios:
+                for count in args.sizes:
+                    key = f"{location}/{scenario}/{count}/workers={args.workers}"
+                    result = run_case(root, count, scenario, args.workers)
+                    line = f"{key:<32} {result['files_per_sec']:>12,.0f} {result['syscalls_per_file']:>14.2f} {result['peak_memory_mb']:>9.2f}"
+                    if args.compare and key in results:
+                        changes, regressed = compare(result, results[key])
+                        line += f"  ({changes}){'  REGRESSION' if regressed else ''}"
+                        if regressed:
+                            regressions.append(key)
+                    print(line, flush=True)
+                    if args.save:
+                        results[key] = result
+        finally:
+            shutil.rmtree(root, ignore_errors=True)
+
+    if args.save:
+        baselines["python"] = platform.python_version()
+        baselines["platform"] = platform.platform()
+        save_baselines(baselines)
+        print(f"Baselines saved to {BASELINES_PATH}")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {REGRESSION_THRESHOLD:.0%}: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 import customtkinter as ctk
 from tkinter import messagebox
+from bisect import bisect_left
+from typing import Sequence
 from pathlib import Path
-from folder_organizer import FileOrganizer, DEFAULT_EXTENSION_TO_TYPE, EXTENSION_FIELDNAME, FILE_TYPE_FIELDNAME, DATA_PATH
-import csv
+from folder_organizer import MAPPING_CACHE, load_mapping, EXTENSION_FIELDNAME, FILE_TYPE_FIELDNAME, DATA_PATH
+from mapping_store import MappingStore
 
 BACKGROUND_COLOR = "#222831"
 SECONDARY_COLOR = "#2E333C"
@@ -18,30 +20,43 @@ class ScrollableTable(ctk.CTkFrame):
     A custom scrollable table widget that extends CTkFrame.
     Creates a table with headers and scrollable content that can have selectable rows.
 
+    Rows are virtualized: the table keeps a pool of row widgets just big enough to fill
+    the visible area, placed on the canvas at the position of the rows in view. When
+    the canvas scrolls, the same widgets are moved and bound to other rows, so the
+    number of widgets and the cost of a refresh don't depend on the size of the data.
+
+    Rows are numbered from 1 in data order. The "others" row is never shown, so the
+    position of a row in the table is computed from its index. After data is changed
+    in place, insert_row, update_row and remove_rows touch only the affected rows;
+    refresh_table is only needed when data is replaced.
+
     Attributes:
         headers (list[str]): List of column headers for the table.
-        data (list[tuple[str, str]]): List of tuples containing row data.
+        data (Sequence[tuple[str, str]]): The row data, such as a MappingStore.
         row_height (int): Height of each table row in pixels.
         column_width (list[int]): List of widths for each column.
         selected_rows (set): Set containing indices of currently selected rows.
+        header_frame (ctk.CTkFrame): Frame with the column headers, above the rows.
         canvas (ctk.CTkCanvas): Canvas widget for scrollable content.
         scrollbar (ctk.CTkScrollbar): Vertical scrollbar for table navigation.
-        scrollable_frame (ctk.CTkFrame): Frame containing the table content.
 
     Methods:
-        refresh_table: Rebuilds the table content with current data.
+        refresh_table: Rebinds the visible rows to the current data.
+        insert_row: Shows a row inserted in data.
+        update_row: Redraws a row changed in data.
+        remove_rows: Removes rows deleted from data.
         toggle_selection: Toggles selection state of a specific row.
         get_selected_rows: Returns list of currently selected row indices.
         bind_mousewheel: Sets up mouse wheel scrolling functionality.
     """
-    def __init__(self, parent: ctk.CTk, headers: list[str], data: list[tuple[str, str]], row_height: int = 30, column_width: list[int] = [200, 200]):
+    def __init__(self, parent: ctk.CTk, headers: list[str], data: Sequence[tuple[str, str]], row_height: int = 30, column_width: list[int] = [200, 200]):
         """
         Initializes the ScrollableTable with specified dimensions and data.
 
         Args:
             parent (ctk.CTk): Parent window containing this widget
             headers (list[str]): List of column headers for the table
-            data (list[tuple[str, str]]): List of tuples containing row data
+            data (Sequence[tuple[str, str]]): The row data, such as a MappingStore
             row_height (int, optional): Height of each table row. Defaults to 30.
             column_width (list[int], optional): List of column widths. Defaults to [200, 200].
         """
@@ -52,12 +67,36 @@ class ScrollableTable(ctk.CTkFrame):
         self.row_height = row_height
         self.column_width = column_width
         self.selected_rows = set()
+
+        # the row of "others", which is not shown; the pool of row widgets with the row each
+        # one is bound to (None when hidden, -1 when stale), and the slot of each bound row
+        self._hidden_row: int | None = None
+        self._pool: list[tuple[int, ctk.CTkFrame, ctk.CTkLabel, ctk.CTkLabel]] = []
+        self._pool_rows: list[int | None] = []
+        self._row_slots: dict[int, int] = {}
+        self._row_pixels = round(row_height * self._get_widget_scaling())
+
+        self.header_frame = ctk.CTkFrame(
+            master=self,
+            fg_color=BACKGROUND_COLOR
+        )
+        for col, header in enumerate(self.headers):
+            header_label = ctk.CTkLabel(
+                master=self.header_frame,
+                text=header,
+                width=self.column_width[col],
+                height=self.row_height,
+                fg_color=SECONDARY_COLOR,
+                text_color=TEXT_COLOR
+            )
+            header_label.grid(row=0, column=col, sticky="nsew")
         
         self.canvas = ctk.CTkCanvas(
             master=self,
             borderwidth=0,
             background=BACKGROUND_COLOR,
-            highlightthickness=0
+            highlightthickness=0,
+            yscrollincrement=self._row_pixels
         )
         self.scrollbar = ctk.CTkScrollbar(
             master=self,
@@ -67,87 +106,176 @@ class ScrollableTable(ctk.CTkFrame):
             button_color=SECONDARY_COLOR,
             button_hover_color=SCROLL_HOVER_COLOR
         )
-        self.scrollable_frame = ctk.CTkFrame(
-            master=self.canvas,
-            fg_color=BACKGROUND_COLOR
-        )
 
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        for col, header in enumerate(self.headers):
-            header_label = ctk.CTkLabel(
-                master=self.scrollable_frame,
-                text=header,
-                width=self.column_width[col],
-                height=self.row_height,
-                fg_color=SECONDARY_COLOR,
-                text_color=TEXT_COLOR
-            )
-            header_label.grid(row=0, column=col, sticky="nsew")
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+        self.canvas.bind("<Configure>", lambda e: self._fill_pool(e.height))
 
         self.refresh_table()
 
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.scrollable_frame.bind("<Configure>", lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all")))
-
+        self.header_frame.pack(side="top", fill="x")
         self.canvas.pack(side="left", fill="both", expand=True)
         self.scrollbar.pack(side="right", fill="y")
         self.bind_mousewheel()
 
+    def _fill_pool(self, height: int) -> None:
+        needed = height // self._row_pixels + 2
+        while len(self._pool) < needed:
+            slot = len(self._pool)
+            row_frame = ctk.CTkFrame(
+                self.canvas,
+                fg_color=ROW_COLOR
+            )
+            first_label = ctk.CTkLabel(
+                row_frame,
+                text="",
+                width=self.column_width[0],
+                height=self.row_height,
+                text_color=TEXT_COLOR
+            )
+            first_label.grid(row=0, column=0)
+            second_label = ctk.CTkLabel(
+                row_frame,
+                text="",
+                width=self.column_width[1],
+                height=self.row_height,
+                text_color=TEXT_COLOR
+            )
+            second_label.grid(row=0, column=1)
+
+            row_frame.bind("<Button-1>", lambda e, s=slot: self._on_row_click(s))
+            for widget in row_frame.winfo_children():
+                widget.bind("<Button-1>", lambda e, s=slot: self._on_row_click(s))
+
+            window = self.canvas.create_window(0, 0, window=row_frame, anchor="nw", state="hidden")
+            self._pool.append((window, row_frame, first_label, second_label))
+            self._pool_rows.append(None)
+        self._render()
+
+    def _on_scroll(self, first: str, last: str) -> None:
+        self.scrollbar.set(first, last)
+        self._render()
+
+    def _on_row_click(self, slot: int) -> None:
+        row = self._pool_rows[slot]
+        if row is not None:
+            self.toggle_selection(row)
+
+    def _row_count(self) -> int:
+        return len(self.data) - (self._hidden_row is not None)
+
+    def _row_at(self, position: int) -> int:
+        row = position + 1
+        if self._hidden_row is not None and row >= self._hidden_row:
+            row += 1
+        return row
+
+    def _render(self) -> None:
+        first = max(0, int(self.canvas.canvasy(0)) // self._row_pixels)
+        row_count = self._row_count()
+        for slot, (window, row_frame, first_label, second_label) in enumerate(self._pool):
+            bound_row = self._pool_rows[slot]
+            position = first + slot
+            if position >= row_count:
+                if bound_row is not None:
+                    self.canvas.itemconfigure(window, state="hidden")
+                    self._row_slots.pop(bound_row, None)
+                    self._pool_rows[slot] = None
+                continue
+
+            row = self._row_at(position)
+            if bound_row != row:
+                col1, col2 = self.data[row - 1]
+                first_label.configure(text=col1)
+                second_label.configure(text=col2)
+                row_frame.configure(fg_color=SELECTED_ROW_COLOR if row in self.selected_rows else ROW_COLOR)
+                self.canvas.coords(window, 0, position * self._row_pixels)
+                self.canvas.itemconfigure(window, state="normal")
+                if self._row_slots.get(bound_row) == slot:
+                    del self._row_slots[bound_row]
+                self._row_slots[row] = slot
+                self._pool_rows[slot] = row
+
+    def _redraw(self) -> None:
+        self._pool_rows = [None if row is None else -1 for row in self._pool_rows]
+        self._row_slots.clear()
+        height = self._row_count() * self._row_pixels
+        self.canvas.configure(scrollregion=(0, 0, sum(self.column_width), height))
+        self._render()
+
     def refresh_table(self) -> None:
         """
-        Rebuilds the table content with current data.
-        Clears existing rows and recreates them with current data.
-        Sets up row selection bindings and styling for each row.
-        """
-        for widget in self.scrollable_frame.grid_slaves():
-            if int(widget.grid_info()["row"]) > 0:
-                widget.destroy()
-
-        for row, (col1, col2) in enumerate(self.data, start=1):
-            if col1 != "others":
-                row_frame = ctk.CTkFrame(
-                    self.scrollable_frame,
-                    fg_color=ROW_COLOR
-                )
-                row_frame.grid(row=row, column=0, columnspan=2, sticky="nsew")
-                
-                ctk.CTkLabel(
-                    row_frame,
-                    text=col1,
-                    width=self.column_width[0],
-                    height=self.row_height,
-                    text_color=TEXT_COLOR
-                ).grid(row=0, column=0)
-                
-                ctk.CTkLabel(
-                    row_frame,
-                    text=col2,
-                    width=self.column_width[1],
-                    height=self.row_height,
-                    text_color=TEXT_COLOR
-                ).grid(row=0, column=1)
-
-                row_frame.bind("<Button-1>", lambda e, r=row: self.toggle_selection(r))
-                for widget in row_frame.winfo_children():
-                    widget.bind("<Button-1>", lambda e, r=row: self.toggle_selection(r))
+        Rebinds the table to the current data, after data was replaced.
+        Only the rows in view are drawn, reusing the existing row widgets; the scroll
+        area is resized to the number of rows.
+        """
+        self._hidden_row = next((row for row, (col1, _) in enumerate(self.data, start=1) if col1 == "others"), None)
+        self._redraw()
+
+    def insert_row(self, row_index: int) -> None:
+        """
+        Shows a row inserted in data. The selection and the rows after it are shifted
+        by one; only the rows in view are redrawn.
+
+        Args:
+            row_index (int): Index of the inserted row, counting from 1
+        """
+        if row_index < len(self.data):
+            self.selected_rows = {row + 1 if row >= row_index else row for row in self.selected_rows}
+            if self._hidden_row is not None and self._hidden_row >= row_index:
+                self._hidden_row += 1
+        if self.data[row_index - 1][0] == "others":
+            self._hidden_row = row_index
+        self._redraw()
+
+    def update_row(self, row_index: int) -> None:
+        """
+        Redraws a row changed in data, if it is in view.
+
+        Args:
+            row_index (int): Index of the changed row, counting from 1
+        """
+        slot = self._row_slots.get(row_index)
+        if slot is not None:
+            col1, col2 = self.data[row_index - 1]
+            self._pool[slot][2].configure(text=col1)
+            self._pool[slot][3].configure(text=col2)
+
+    def remove_rows(self, row_indices: list[int]) -> None:
+        """
+        Removes rows deleted from data. They leave the selection and the rows after them
+        are shifted back; only the rows in view are redrawn.
+
+        Args:
+            row_indices (list[int]): Indices of the rows before the deletion, counting from 1
+        """
+        removed = sorted(set(row_indices))
+
+        def shifted(row: int) -> int:
+            return row - bisect_left(removed, row)
+
+        self.selected_rows = {shifted(row) for row in self.selected_rows if row not in removed}
+        if self._hidden_row is not None:
+            self._hidden_row = None if self._hidden_row in removed else shifted(self._hidden_row)
+        self._redraw()
 
     def toggle_selection(self, row_index: int) -> None:
         """
         Toggles selection state of a specific row.
-        Changes row background color and updates selected_rows set.
+        Updates selected_rows set and the background color of the row, if it is in view.
 
         Args:
             row_index (int): Index of the row to toggle selection
         """
-        row_frame = self.scrollable_frame.grid_slaves(row=row_index)[0]
-        
         if row_index in self.selected_rows:
             self.selected_rows.remove(row_index)
-            row_frame.configure(fg_color=ROW_COLOR)
+            color = ROW_COLOR
         else:
             self.selected_rows.add(row_index)
-            row_frame.configure(fg_color=SELECTED_ROW_COLOR)
+            color = SELECTED_ROW_COLOR
+
+        slot = self._row_slots.get(row_index)
+        if slot is not None:
+            self._pool[slot][1].configure(fg_color=color)
 
     def get_selected_rows(self) -> list[int]:
         """
@@ -183,7 +311,7 @@ class DataManager:
     Attributes:
         filename (Path): Path to the CSV file storing extension mappings.
         headers (list[str]): Column headers for the CSV file.
-        data (list[tuple[str, str]]): List of tuples containing extension mappings.
+        data (MappingStore): The extension mappings, indexed by extension and file type.
 
     Methods:
         load_data: Loads extension mappings from CSV file or defaults.
@@ -206,35 +334,25 @@ class DataManager:
     def load_data(self) -> None:
         """
         Loads extension mappings from CSV file or defaults.
-        Creates new data with defaults if file doesn't exist, otherwise reads mappings from CSV file.
+        Uses the process-wide mapping cache, which creates the file with the defaults
+        if it doesn't exist and only parses it again when it changed. The cached store
+        is shared, so an editable copy is kept.
         """
-        if not self.filename.exists():
-            file_organizer = FileOrganizer()
-            self.data = list(DEFAULT_EXTENSION_TO_TYPE.items())
-            del file_organizer
-        else:
-            self.data = []
-            with open(self.filename, 'r', newline='', encoding='utf-8') as file:
-                reader = csv.reader(file)
-                next(reader)
-                for row in reader:
-                    self.data.append(tuple(row))
-        
+        self.data = MappingStore(load_mapping()[0])
 
     def save_data(self) -> None:
         """
         Saves current extension mappings to CSV file.
-        Writes current headers and data to the CSV file.
+        The write is scheduled on the mapping cache, which coalesces a burst of edits
+        into one atomic write of the file, done shortly after the last edit, before the
+        mappings are read again, or at exit.
         """
-        with open(self.filename, 'w', newline='', encoding='utf-8') as file:
-            writer = csv.writer(file)
-            writer.writerow(self.headers)
-            writer.writerows(self.data)
+        MAPPING_CACHE.save(self.data)
 
     def extension_exists(self, extension: str) -> bool:
         """
         Checks if an extension already exists in mappings.
-        Case-insensitive comparison of extensions.
+        Case-insensitive lookup in the index of the store.
 
         Args:
             extension (str): File extension to check
@@ -242,7 +360,7 @@ class DataManager:
         Returns:
             bool: True if extension exists, False otherwise
         """
-        return any(ext.lower() == extension.lower() for ext, _ in self.data)
+        return extension in self.data
 
     def update_others_value(self, new_value: str) -> None:
         """
@@ -252,10 +370,7 @@ class DataManager:
         Args:
             new_value (str): New default type for unmapped extensions.
         """
-        for i, (ext, type_) in enumerate(self.data):
-            if ext == "others":
-                self.data[i] = ("others", new_value)
-                break
+        self.data.put("others", new_value)
         self.save_data()
 
     def add_item(self, item: str, value: str) -> None:
@@ -270,9 +385,7 @@ class DataManager:
         Raises:
             ValueError: If extension already exists.
         """
-        if self.extension_exists(item):
-            raise ValueError("Esta extensão já existe!")
-        self.data.append((item, value))
+        self.data.add(item, value)
         self.save_data()
 
     def edit_item(self, index: int, value: str) -> None:
@@ -284,20 +397,18 @@ class DataManager:
             index (int): Index of mapping to modify.
             value (str): New file type value.
         """
-        self.data[index - 1] = (self.data[index - 1][0], value)
+        self.data.set_type(index - 1, value)
         self.save_data()
 
     def delete_items(self, indices: list[int]) -> None:
         """
         Removes selected extension mappings.
-        Deletes mappings at specified indices and saves changes.
+        Deletes mappings at specified indices in a single pass and saves changes.
 
         Args:
             indices (list[int]): List of indices to remove.
         """
-        indices = sorted(indices, reverse=True)
-        for index in indices:
-            del self.data[index - 1]
+        self.data.delete(index - 1 for index in indices)
         self.save_data()
 
 
@@ -315,6 +426,7 @@ class SettingsFrame(ctk.CTkFrame):
         data_manager (DataManager): Instance managing data operations.
 
     Methods:
+        reload_data: Reloads the mappings if the CSV file changed.
         update_default_value: Updates the default type for unmapped extensions.
         restore_default: Resets all mappings to system defaults.
         show_add_dialog: Shows dialog for adding new extension mapping.
@@ -365,11 +477,7 @@ class SettingsFrame(ctk.CTkFrame):
             ).pack(side="left", padx=2)
         
         self.data_manager = DataManager()
-        
-        for ext, type in self.data_manager.data:
-            if ext == "others":
-                self.default_entry_var.set(type)
-                break
+        self._load_default_value()
         
         frame_padding = 10
         scrollbar_width = 20
@@ -379,6 +487,24 @@ class SettingsFrame(ctk.CTkFrame):
         self.table = ScrollableTable(self, headers=self.data_manager.headers, data=self.data_manager.data, row_height=30, column_width=[column_width, column_width])
         self.table.place(relx=0.5, y=60, relwidth=0.98, relheight=0.85, anchor="n")
 
+    def _load_default_value(self) -> None:
+        default_value = self.data_manager.data.get("others")
+        if default_value is not None:
+            self.default_entry_var.set(default_value)
+
+    def reload_data(self) -> None:
+        """
+        Reloads the mappings when the frame is shown again.
+        The table is only rebuilt if the CSV file was changed outside the frame.
+        """
+        data = self.data_manager.data
+        self.data_manager.load_data()
+        if self.data_manager.data != data:
+            self._load_default_value()
+            self.table.data = self.data_manager.data
+            self.table.selected_rows.clear()
+            self.table.refresh_table()
+
     def update_default_value(self) -> None:
         """
         Updates the default file type for unmapped extensions.
@@ -399,10 +525,9 @@ class SettingsFrame(ctk.CTkFrame):
         Updates table display after restore.
         """
         if messagebox.askyesno("Confirmar", "Deseja realmente restauras os dados padrão?"):
+            MAPPING_CACHE.flush()
             DATA_PATH.unlink(missing_ok=True)
-            file_organizer = FileOrganizer()
-            self.data_manager.data = list(DEFAULT_EXTENSION_TO_TYPE.items())
-            del file_organizer
+            self.data_manager.load_data()
             self.table.data = self.data_manager.data
             self.table.refresh_table()
 
@@ -460,8 +585,7 @@ class SettingsFrame(ctk.CTkFrame):
             if ext and type:
                 try:
                     self.data_manager.add_item(ext, type)
-                    self.table.data = self.data_manager.data
-                    self.table.refresh_table()
+                    self.table.insert_row(len(self.data_manager.data))
                     dialog.destroy()
                 except ValueError as e:
                     messagebox.showwarning("Aviso", str(e))
@@ -531,8 +655,7 @@ class SettingsFrame(ctk.CTkFrame):
             type = type_entry.get()
             if type:
                 self.data_manager.edit_item(row_index, type)
-                self.table.data = self.data_manager.data
-                self.table.refresh_table()
+                self.table.update_row(row_index)
                 dialog.destroy()
             else:
                 messagebox.showwarning("Aviso", "Preencha o campo de tipo!")
@@ -560,6 +683,4 @@ class SettingsFrame(ctk.CTkFrame):
 
         if messagebox.askyesno("Confirmar", "Deseja realmente excluir os itens selecionados?"):
             self.data_manager.delete_items(selected)
-            self.table.data = self.data_manager.data
-            self.table.selected_rows.clear()
-            self.table.refresh_table()
\ No newline at end of file
+            self.table.remove_rows(selected)
\ No newline at end of file
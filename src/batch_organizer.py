@@ -0,0 +1,164 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator, NamedTuple
+import os
+from error_log import ErrorLog
+from error_records import ErrorSummary, MAX_ERROR_SAMPLES
+from folder_organizer import FileOrganizer, MAPPING_CACHE, ErrorEvent, MoveEvent, print_errors
+
+
+class DirectoryResult(NamedTuple):
+    """
+    The result of organizing (or restoring) one directory of a batch.
+
+    Attributes:
+        directory (str): Path of the directory.
+        success (bool): Whether the operation could be completed.
+        moved (int): Number of files moved (always 0 when restoring).
+        errors (ErrorSummary): The errors on single files.
+        error (str | None): Why the operation failed, when it did.
+    """
+    directory: str
+    success: bool
+    moved: int
+    errors: ErrorSummary
+    error: str | None = None
+
+
+_organizer: FileOrganizer | None = None
+
+
+def _init_worker(signature: tuple[int, int] | None, file_type_dict: dict[str, str], options: dict) -> None:
+    global _organizer
+    MAPPING_CACHE.preload(signature, file_type_dict)
+    _organizer = FileOrganizer(**options)
+
+
+def _process_directory(directory: str, undo: bool) -> DirectoryResult:
+    try:
+        return _run_directory(directory, undo)
+    except Exception as e:
+        return DirectoryResult(directory, False, 0, ErrorSummary(0), str(e))
+
+
+def _run_directory(directory: str, undo: bool) -> DirectoryResult:
+    if undo:
+        success, errors = _organizer.undo_folder(directory)
+        if not success:
+            return DirectoryResult(directory, False, 0, ErrorSummary(0), errors)
+        return DirectoryResult(directory, True, 0, errors)
+
+    success, events = _organizer.iter_organize(directory)
+    if not success:
+        return DirectoryResult(directory, False, 0, ErrorSummary(0), events)
+
+    moved = 0
+    errors = ErrorSummary(_organizer.max_error_samples)
+    for event in events:
+        if type(event) is MoveEvent:
+            moved += 1
+        elif type(event) is ErrorEvent:
+            errors.add(event.record)
+    return DirectoryResult(directory, True, moved, errors)
+
+
+def read_directory_list(list_path: str) -> list[str]:
+    """
+    Read a file listing directories, one per line. Blank lines and lines starting
+    with # are ignored.
+
+    Args:
+        list_path (str): Path of the list file.
+
+    Returns:
+        list[str]: The directories, in file order.
+    """
+    with open(list_path, "r", encoding="utf-8") as list_file:
+        lines = (line.strip() for line in list_file)
+        return [line for line in lines if line and not line.startswith("#")]
+
+
+def process_directories(directories: list[str], options: dict, processes: int | None = None, undo: bool = False) -> Iterator[DirectoryResult]:
+    """
+    Organize (or restore) many directories on a pool of processes.
+
+    The mapping is loaded once here and handed to each worker process when it starts,
+    together with the organizer options, so workers neither parse the CSV file nor
+    build an organizer per directory.
+
+    Args:
+        directories (list[str]): Absolute paths of the directories.
+        options (dict): Keyword arguments for the FileOrganizer of each worker.
+        processes (int | None, optional): Number of worker processes. Defaults to the
+            number of CPUs, but never more than the number of directories.
+        undo (bool, optional): Whether the last organization of each directory is
+            undone instead. Defaults to False.
+
+    Returns:
+        Iterator[DirectoryResult]: The results, in the order the directories finish.
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(directories)))
+
+    signature, file_type_dict = MAPPING_CACHE.export()
+    with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker, initargs=(signature, file_type_dict, options)) as executor:
+        futures = [executor.submit(_process_directory, directory, undo) for directory in directories]
+        try:
+            for future in as_completed(futures):
+                yield future.result()
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def run_batch(directories: list[str], options: dict, processes: int | None = None, undo: bool = False, error_log: ErrorLog | None = None) -> None:
+    """
+    Process many directories from the command line, printing one line per directory
+    as it finishes and a consolidated summary at the end.
+
+    The errors of all directories are merged into a single summary, which keeps at
+    most max_error_samples records (from the options) however many directories fail.
+
+    Args:
+        directories (list[str]): Absolute paths of the directories.
+        options (dict): Keyword arguments for the FileOrganizer of each worker.
+        processes (int | None, optional): Number of worker processes. Defaults to None.
+        undo (bool, optional): Whether the last organization of each directory is
+            undone instead. Defaults to False.
+        error_log (ErrorLog | None, optional): Where the failed directories and the
+            sampled errors are also recorded. Defaults to None.
+    """
+    total = len(directories)
+    completed = 0
+    failed = 0
+    moved = 0
+    errors = ErrorSummary(options.get("max_error_samples", MAX_ERROR_SAMPLES))
+    failures = []
+
+    for result in process_directories(directories, options, processes, undo):
+        completed += 1
+        moved += result.moved
+        if not result.success:
+            failed += 1
+            failures.append((result.directory, result.error))
+            status = f"falhou: {result.error}"
+        elif undo:
+            status = "restaurado" + (f", {len(result.errors)} erro(s)" if result.errors else "")
+        else:
+            status = f"{result.moved} arquivo(s) movido(s)" + (f", {len(result.errors)} erro(s)" if result.errors else "")
+        print(f"[{completed}/{total}] {result.directory}: {status}", flush=True)
+        errors.merge(result.errors)
+
+    action = "Restauração" if undo else "Organização"
+    if error_log is not None:
+        for directory, error in failures:
+            error_log.add_log("Critical Error", f"Falha na {action.lower()}", f"{directory}: {error}")
+        error_log.add_errors(errors, "Erro ao restaurar arquivo" if undo else "Erro ao mover arquivo")
+    print(f"\n{action} em lote concluída: {total - failed} de {total} diretório(s)" + ("." if undo else f", {moved} arquivo(s) movido(s)."))
+    if failures:
+        print("Diretórios não processados:")
+        for directory, error in failures:
+            print(f"- [{directory}] {error}")
+    if errors:
+        print(f"Erros encontrados ({len(errors)}):")
+        print_errors(errors)
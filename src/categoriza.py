@@ -0,0 +1,21 @@
+from sys import argv
+
+
+def main() -> None:
+    """
+    Entry point for both interfaces.
+
+    With command-line arguments, the CLI of folder_organizer is run and the GUI stack
+    (customtkinter, PIL and the settings views) is never imported. Without arguments,
+    the GUI is opened.
+    """
+    if len(argv) > 1:
+        from folder_organizer import main as cli_main
+        cli_main()
+    else:
+        from folder_organizer_app import App
+        App()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+from pathlib import Path
+import json
+import os
+import struct
+
+CONTENT_CACHE_PATH = Path(__file__).parent.parent / "content_cache.json"
+MAX_CACHE_ENTRIES = 200_000
+CACHE_VERSION = 2
+HEADER_SIZE = 4096
+BMP_INFO_HEADER_SIZES = (12, 40, 52, 56, 64, 108, 124)
+
+# (offset, magic bytes, extension), checked in order. Short signatures that text
+# files may also start with are confirmed by the VALIDATORS of their extension.
+SIGNATURES = (
+    (0, b"%PDF-", ".pdf"),
+    (0, b"\x89PNG\r\n\x1a\n", ".png"),
+    (0, b"\xff\xd8\xff", ".jpg"),
+    (0, b"GIF87a", ".gif"),
+    (0, b"GIF89a", ".gif"),
+    (0, b"BM", ".bmp"),
+    (0, b"II*\x00", ".tiff"),
+    (0, b"MM\x00*", ".tiff"),
+    (8, b"WEBP", ".webp"),
+    (8, b"WAVE", ".wav"),
+    (8, b"AVI ", ".avi"),
+    (0, b"ID3", ".mp3"),
+    (0, b"fLaC", ".flac"),
+    (0, b"OggS", ".ogg"),
+    (4, b"ftyp", ".mp4"),
+    (0, b"\x1a\x45\xdf\xa3", ".mkv"),
+    (0, b"PK\x03\x04", ".zip"),
+    (0, b"Rar!\x1a\x07", ".rar"),
+    (0, b"7z\xbc\xaf\x27\x1c", ".7z"),
+    (0, b"\x1f\x8b", ".gz"),
+    (0, b"BZh", ".bz2"),
+    (0, b"\xfd7zXZ\x00", ".xz"),
+    (257, b"ustar", ".tar"),
+    (0, b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", ".doc"),
+    (0, b"\x7fELF", ".bin"),
+    (0, b"MZ", ".exe"),
+    (0, b"#!/", ".sh"),
+    (0, b"#! /", ".sh"),
+    (0, b"<?xml", ".xml"),
+)
+
+
+class ContentDetector:
+    """
+    Detects the extension of a file from its first bytes (magic numbers).
+
+    Only the first HEADER_SIZE bytes are read, with a single pread where available.
+    Results are cached persistently, keyed on (device, inode, size, mtime), so a file
+    that didn't change is never read twice, even across runs or after being moved
+    within the same filesystem. The cache is versioned, so results of older
+    signature tables are discarded.
+
+    Attributes:
+        cache_path (Path): Path of the persistent cache file.
+        cache (dict[str, str] | None): Detected extension ("" for unknown) by file key,
+            loaded on first use.
+
+    Methods:
+        detect: Detect the extension of a file from its contents.
+        save: Save the cache, if it changed.
+    """
+
+    def __init__(self, cache_path: Path = CONTENT_CACHE_PATH):
+        self.cache_path = cache_path
+        self.cache: dict[str, str] | None = None
+        self._dirty = False
+
+    def _load_cache(self) -> dict[str, str]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as cache_file:
+                data = json.load(cache_file)
+            if isinstance(data, dict) and data.get("version") == CACHE_VERSION and isinstance(data.get("entries"), dict):
+                return data["entries"]
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def detect(self, file_path: str, file_stat: os.stat_result | None = None) -> str | None:
+        """
+        Detect the extension of a file from its contents.
+
+        Args:
+            file_path (str): Path of the file.
+            file_stat (os.stat_result | None, optional): The stat of the file, if the
+                caller already has it. A stat without inode (as returned by DirEntry
+                on Windows) is taken again. Defaults to None.
+
+        Returns:
+            str | None: The detected extension (such as ".pdf"), or None if unknown.
+        """
+        if self.cache is None:
+            self.cache = self._load_cache()
+
+        if file_stat is None or not file_stat.st_ino:
+            try:
+                file_stat = os.stat(file_path)
+            except OSError:
+                return None
+        key = f"{file_stat.st_dev}:{file_stat.st_ino}:{file_stat.st_size}:{file_stat.st_mtime_ns}"
+
+        extension = self.cache.get(key)
+        if extension is None:
+            try:
+                header = read_header(file_path)
+            except OSError:
+                return None
+            extension = match_signature(header) or ""
+            self.cache[key] = extension
+            self._dirty = True
+        return extension or None
+
+    def save(self) -> None:
+        """
+        Save the cache, if it changed. Only the newest MAX_CACHE_ENTRIES entries are kept.
+        The cache is written to a temporary file and renamed over the old one, so an
+        interrupted save never leaves it truncated.
+        """
+        if not self._dirty:
+            return
+        if len(self.cache) > MAX_CACHE_ENTRIES:
+            keys = list(self.cache)[-MAX_CACHE_ENTRIES:]
+            self.cache = {key: self.cache[key] for key in keys}
+        temporary_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            with open(temporary_path, "w", encoding="utf-8") as cache_file:
+                json.dump({"version": CACHE_VERSION, "entries": self.cache}, cache_file, separators=(",", ":"))
+                cache_file.flush()
+                os.fsync(cache_file.fileno())
+            os.replace(temporary_path, self.cache_path)
+            self._dirty = False
+        except OSError:
+            try:
+                os.unlink(temporary_path)
+            except OSError:
+                pass
+
+
+def read_header(file_path: str) -> bytes:
+    """
+    Read the first HEADER_SIZE bytes of a file.
+
+    Args:
+        file_path (str): Path of the file.
+
+    Returns:
+        bytes: The bytes read (fewer for small files).
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "pread"):
+            return os.pread(fd, HEADER_SIZE, 0)
+        return os.read(fd, HEADER_SIZE)
+    finally:
+        os.close(fd)
+
+
+def match_signature(header: bytes) -> str | None:
+    """
+    Match the first bytes of a file against the signature table. A signature with a
+    validator only matches if the validator accepts the header too.
+
+    Args:
+        header (bytes): The first bytes of the file.
+
+    Returns:
+        str | None: The extension of the first matching signature, or None.
+    """
+    for offset, magic, extension in SIGNATURES:
+        if header.startswith(magic, offset):
+            validator = VALIDATORS.get(extension)
+            if validator is None or validator(header):
+                return extension
+    return None
+
+
+def _is_bmp(header: bytes) -> bool:
+    if len(header) < 18:
+        return False
+    reserved, pixels_offset, info_size = struct.unpack_from("<IIi", header, 6)
+    return reserved == 0 and info_size in BMP_INFO_HEADER_SIZES and pixels_offset >= 14 + info_size
+
+
+def _is_pe(header: bytes) -> bool:
+    if len(header) < 64:
+        return False
+    pe_offset = struct.unpack_from("<I", header, 0x3C)[0]
+    return header.startswith(b"PE\x00\x00", pe_offset)
+
+
+# Extra checks of a matched signature, by extension
+VALIDATORS = {
+    ".bmp": _is_bmp,
+    ".exe": _is_pe,
+}
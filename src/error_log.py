@@ -0,0 +1,292 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+import json
+import os
+import time
+from error_records import ErrorRecord, ErrorSummary
+
+LOG_PATH = Path(__file__).parent.parent / "errors.jsonl"
+MAX_LOG_BYTES = 1024 * 1024
+LOG_BACKUPS = 3
+FLUSH_ENTRIES = 256
+READ_BLOCK_SIZE = 64 * 1024
+
+
+class LogEntry:
+    """
+    A single entry of the error log.
+
+    The timestamp is kept as returned by time.time() and the detail may be an
+    ErrorRecord; both are only turned into text by format, when the log is displayed.
+
+    Attributes:
+        timestamp (float): Time when the error occurred
+        type (str): Type of the error
+        short_message (str): Brief error description
+        detail (str | ErrorRecord): Detailed error information
+
+    Methods:
+        format: Formats the entry as shown in the log window.
+        matches: Checks whether the entry contains a text.
+        to_json: Serializes the entry as a line of the log file.
+        from_json: Reads an entry from a line of the log file.
+    """
+    __slots__ = ("timestamp", "type", "short_message", "detail")
+
+    def __init__(self, timestamp: float, error_type: str, short_message: str, detail: str | ErrorRecord):
+        self.timestamp = timestamp
+        self.type = error_type
+        self.short_message = short_message
+        self.detail = detail
+
+    @property
+    def detailed_message(self) -> str:
+        """
+        The detailed error information, as text.
+        """
+        return str(self.detail)
+
+    def format(self) -> str:
+        """
+        Formats the entry as shown in the log window.
+
+        Returns:
+            str: The timestamp, type, message and details of the entry.
+        """
+        timestamp = datetime.fromtimestamp(self.timestamp).strftime("%Y-%m-%d %H:%M:%S")
+        return (
+            f"[{timestamp}] {self.type}\n"
+            f"Mensagem: {self.short_message}\n"
+            f"Detalhes: {self.detailed_message}\n"
+            f"{'-' * 60}\n\n"
+        )
+
+    def matches(self, query: str) -> bool:
+        """
+        Checks whether the type, message or details of the entry contain a text.
+
+        Args:
+            query (str): The text, already casefolded
+
+        Returns:
+            bool: True if the text was found
+        """
+        return (
+            query in self.type.casefold()
+            or query in self.short_message.casefold()
+            or query in self.detailed_message.casefold()
+        )
+
+    def to_json(self) -> str:
+        """
+        Serializes the entry as a line of the log file. An ErrorRecord is stored by
+        its fields, so it is still formatted only when displayed.
+
+        Returns:
+            str: The JSON line, without the line break.
+        """
+        detail = self.detail
+        if isinstance(detail, ErrorRecord):
+            detail = [detail.operation, detail.kind, detail.code, detail.path, detail.detail]
+        return json.dumps([self.timestamp, self.type, self.short_message, detail], ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, line: str | bytes) -> "LogEntry":
+        """
+        Reads an entry from a line of the log file.
+
+        Args:
+            line (str | bytes): The JSON line.
+
+        Returns:
+            LogEntry: The entry.
+
+        Raises:
+            ValueError: If the line is not a valid entry.
+        """
+        try:
+            timestamp, error_type, short_message, detail = json.loads(line)
+            if isinstance(detail, list):
+                operation, kind, code, path, text = detail
+                detail = ErrorRecord(operation, kind, code, path, timestamp, text)
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Entrada de log inválida: {e}") from e
+        return cls(timestamp, error_type, short_message, detail)
+
+
+def read_lines_backwards(path: Path, end: int | None = None) -> Iterator[bytes]:
+    """
+    Iterate over the non-empty lines of a file from the last to the first.
+
+    The file is read backwards one READ_BLOCK_SIZE block at a time, so only the lines
+    actually consumed are loaded. A missing file has no lines.
+
+    Args:
+        path (Path): Path of the file.
+        end (int | None, optional): Offset where reading starts, such as the size of the
+            file at an earlier point. Defaults to None (the end of the file).
+
+    Returns:
+        Iterator[bytes]: The lines, without their line breaks, newest first.
+    """
+    try:
+        log_file = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with log_file:
+        position = os.fstat(log_file.fileno()).st_size if end is None else end
+        remainder = b""
+        while position > 0:
+            size = min(READ_BLOCK_SIZE, position)
+            position -= size
+            log_file.seek(position)
+            lines = (log_file.read(size) + remainder).split(b"\n")
+            remainder = lines.pop(0)
+            for line in reversed(lines):
+                if line:
+                    yield line
+        if remainder:
+            yield remainder
+
+
+class ErrorLog:
+    """
+    A class to manage and store error logs.
+
+    Entries are appended to a JSON Lines file shared by the GUI and the command line,
+    so the log survives between runs. Appends are buffered and written FLUSH_ENTRIES
+    at a time (or on flush); once the file grows past max_bytes it is rotated to
+    path.1, path.2 and so on, keeping at most backups old files.
+
+    Attributes:
+        path (Path): Path of the log file.
+        max_bytes (int): Size above which the log file is rotated.
+        backups (int): Number of rotated files kept.
+
+    Methods:
+        add_log: Adds a new error entry to the log with timestamp and provided information.
+        add_errors: Adds an entry per sampled error of a run, and one with the counts of the rest.
+        get_logs: Iterates over the logged errors, newest first, reading the files lazily.
+        flush: Writes the buffered entries to the log file.
+        clear_logs: Removes all errors from the log, resetting it to empty state.
+    """
+
+    def __init__(self, path: Path = LOG_PATH, max_bytes: int = MAX_LOG_BYTES, backups: int = LOG_BACKUPS):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._buffer: list[str] = []
+
+    def add_log(self, error_type: str, short_message: str, detailed_message: str | ErrorRecord) -> None:
+        """
+        Adds a new error entry to the log with the current timestamp.
+        Nothing is formatted here; an ErrorRecord is stored as it is, with its own timestamp.
+        The entry is buffered, and written with the next FLUSH_ENTRIES - 1 ones or on flush.
+
+        Args:
+            error_type (str): Type of the error (e.g., 'CSV Error', 'File Error', etc)
+            short_message (str): Brief message for notification display
+            detailed_message (str | ErrorRecord): Complete error message for the log, or the
+                record of an error on a file
+        """
+        if isinstance(detailed_message, ErrorRecord):
+            timestamp = detailed_message.timestamp
+        else:
+            timestamp = time.time()
+        self._buffer.append(LogEntry(timestamp, error_type, short_message, detailed_message).to_json())
+        if len(self._buffer) >= FLUSH_ENTRIES:
+            self.flush()
+
+    def add_errors(self, errors: ErrorSummary, short_message: str = "Erro ao mover arquivo") -> None:
+        """
+        Adds a "File Error" entry for each sampled error of a run and, when some errors
+        were only counted, one more entry with the number of errors of each kind.
+
+        Args:
+            errors (ErrorSummary): The errors of the run
+            short_message (str, optional): Brief message of each entry. Defaults to
+                "Erro ao mover arquivo".
+        """
+        for record in errors:
+            self.add_log("File Error", short_message, record)
+        if errors.omitted:
+            self.add_log(
+                "File Error",
+                f"Mais {errors.omitted} erro(s) não detalhados",
+                "; ".join(errors.format_counts())
+            )
+
+    def flush(self) -> None:
+        """
+        Writes the buffered entries to the log file with a single append, rotating the
+        file first if the append would take it past max_bytes. Errors writing the log
+        are ignored, so logging never interrupts an organization.
+        """
+        if not self._buffer:
+            return
+        data = ("\n".join(self._buffer) + "\n").encode("utf-8")
+        self._buffer.clear()
+        try:
+            try:
+                size = self.path.stat().st_size
+            except FileNotFoundError:
+                size = 0
+            if size and size + len(data) > self.max_bytes:
+                self._rotate()
+            with open(self.path, "ab") as log_file:
+                log_file.write(data)
+        except OSError:
+            pass
+
+    def _rotate(self) -> None:
+        for index in range(self.backups - 1, 0, -1):
+            older = self._backup_path(index)
+            if older.exists():
+                os.replace(older, self._backup_path(index + 1))
+        if self.backups:
+            os.replace(self.path, self._backup_path(1))
+        else:
+            self.path.unlink(missing_ok=True)
+
+    def _backup_path(self, index: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{index}")
+
+    def get_logs(self) -> Iterator[LogEntry]:
+        """
+        Iterates over the logged errors from the newest to the oldest.
+
+        The buffer is flushed first, then the log file and its rotated copies are read
+        backwards, one block at a time, so only the entries actually consumed are loaded.
+        Entries appended after the call are not included; invalid lines are skipped.
+
+        Returns:
+            Iterator[LogEntry]: The log entries, newest first
+        """
+        self.flush()
+        try:
+            end = self.path.stat().st_size
+        except OSError:
+            end = 0
+        return self._iter_entries(end)
+
+    def _iter_entries(self, end: int) -> Iterator[LogEntry]:
+        paths = [(self.path, end)] + [(self._backup_path(index), None) for index in range(1, self.backups + 1)]
+        for path, path_end in paths:
+            for line in read_lines_backwards(path, path_end):
+                try:
+                    yield LogEntry.from_json(line)
+                except ValueError:
+                    continue
+
+    def clear_logs(self) -> None:
+        """
+        Removes all recorded error logs from the system.
+        Discards the buffered entries and deletes the log file and its rotated copies.
+        """
+        self._buffer.clear()
+        for path in [self.path] + [self._backup_path(index) for index in range(1, self.backups + 1)]:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
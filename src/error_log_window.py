@@ -1,76 +1,37 @@
 import customtkinter as ctk
-from datetime import datetime
-
-class ErrorLog:
-    """
-    A class to manage and store error logs.
-
-    Attributes:
-        logs (list[dict]): List of dictionaries containing error information.
-            Each dictionary has the following keys:
-            - timestamp (str): Time when the error occurred
-            - type (str): Type of the error
-            - short_message (str): Brief error description
-            - detailed_message (str): Detailed error information
-
-    Methods:
-        add_log: Adds a new error entry to the log with timestamp and provided information.
-        get_logs: Returns all logged errors as a list of dictionaries.
-        clear_logs: Removes all errors from the log, resetting it to empty state.
-    """
-
-    def __init__(self):
-        self.logs: list[dict] = []
-        
-    def add_log(self, error_type: str, short_message: str, detailed_message: str) -> None:
-        """
-        Adds a new error entry to the log with the current timestamp.
-        Creates a dictionary with error information and appends it to the logs list.
-
-        Args:
-            error_type (str): Type of the error (e.g., 'CSV Error', 'File Error', etc)
-            short_message (str): Brief message for notification display
-            detailed_message (str): Complete error message for the log
-        """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        self.logs.append({
-            "timestamp": timestamp,
-            "type": error_type,
-            "short_message": short_message,
-            "detailed_message": detailed_message
-        })
-    
-    def get_logs(self) -> list[dict]:
-        """
-        Retrieves all recorded error logs from the error tracking system.
-        Provides access to the complete history of errors that have been logged.
-
-        Returns:
-            list[dict]: A list of dictionaries containing error logs
-        """
-        return self.logs
-    
-    def clear_logs(self) -> None:
-        """
-        Removes all recorded error logs from the system.
-        Resets the log history to an empty state.
-        """
-        self.logs.clear()
+from itertools import islice
+from typing import Iterator
+from error_log import ErrorLog, LogEntry
 
+LOG_PAGE_SIZE = 100
+FILTER_DELAY = 300
 
 class LogWindow(ctk.CTkToplevel):
     """
     A window to display error logs.
-    Creates a top-level window with a text display for errors and a clear button.
+    Creates a top-level window with a filter box, a text display for errors, page
+    navigation and a clear button. Closing the window only hides it, so it is built
+    once and reused with show.
+
+    Only one page of entries, newest first, is formatted and inserted at a time, with a
+    single insert. Entries are read from the log lazily as pages are visited, so opening
+    the window costs the same with a hundred or a million logged errors.
 
     Attributes:
         error_log (ErrorLog): Instance containing the error logs to display
+        filter_entry (ctk.CTkEntry): Entry for the text the entries must contain
         log_text (ctk.CTkTextbox): Text widget to display the logs
+        previous_button (ctk.CTkButton): Button to show the previous page
+        page_label (ctk.CTkLabel): Label with the current page
+        next_button (ctk.CTkButton): Button to show the next page
         clear_button (ctk.CTkButton): Button to clear all logs
+        page (int): Index of the current page
 
     Methods:
-        update_log_display: Updates the text widget content with current logs from error_log instance.
+        show: Shows the window again with the current logs.
+        hide: Hides the window, keeping it for the next use.
+        update_log_display: Reads the logs again from the first page.
+        show_page: Renders one page of entries.
         clear_logs: Clears all logs from error_log instance and updates the display.
     """
 
@@ -100,52 +61,128 @@ class LogWindow(ctk.CTkToplevel):
         self.grab_set()
         
         self.error_log: ErrorLog = error_log
+        self.page: int = 0
+        self._entries: Iterator[LogEntry] = iter(())
+        self._loaded: list[LogEntry] = []
+        self._filter_job: str | None = None
+
+        self.filter_entry: ctk.CTkEntry = ctk.CTkEntry(
+            self,
+            width=580,
+            placeholder_text="Filtrar logs...",
+            font=("Consolas", 12)
+        )
+        self.filter_entry.pack(padx=10, pady=(10, 0))
+        self.filter_entry.bind("<KeyRelease>", self.schedule_filter)
             
         self.log_text: ctk.CTkTextbox = ctk.CTkTextbox(
             self,
             width=580,
-            height=350,
+            height=290,
             font=("Consolas", 12)
         )
         self.log_text.pack(padx=10, pady=10)
+
+        self.controls_frame: ctk.CTkFrame = ctk.CTkFrame(self, fg_color="transparent")
+        self.controls_frame.pack(fill="x", padx=10, pady=(0, 5))
+
+        self.previous_button: ctk.CTkButton = self._create_button("<", lambda: self.show_page(self.page - 1), 30)
+        self.previous_button.pack(side="left")
+
+        self.page_label: ctk.CTkLabel = ctk.CTkLabel(self.controls_frame, text="", font=("Tahoma", 12), text_color="#EEEEEE")
+        self.page_label.pack(side="left", padx=8)
+
+        self.next_button: ctk.CTkButton = self._create_button(">", lambda: self.show_page(self.page + 1), 30)
+        self.next_button.pack(side="left")
         
-        self.clear_button: ctk.CTkButton = ctk.CTkButton(
-            self,
-            text="Limpar Logs",
+        self.clear_button: ctk.CTkButton = self._create_button("Limpar Logs", self.clear_logs, 100)
+        self.clear_button.pack(side="right")
+
+        self.bind("<Escape>", lambda e: self.hide())
+        self.protocol("WM_DELETE_WINDOW", self.hide)
+        
+        self.update_log_display()
+
+    def _create_button(self, text: str, command, width: int) -> ctk.CTkButton:
+        return ctk.CTkButton(
+            self.controls_frame,
+            text=text,
             font=("Tahoma", 14, "bold"),
-            command=self.clear_logs,
-            width=100,
+            command=command,
+            width=width,
             fg_color="#00ADB5",
             text_color="#EEEEEE",
             hover=False
         )
-        self.clear_button.pack(pady=(0, 5))
 
-        self.bind("<Escape>", lambda e: self.destroy())
-        
+    def show(self) -> None:
+        """
+        Shows the window again, with the logs recorded since it was hidden.
+        """
         self.update_log_display()
+        self.deiconify()
+        self.lift()
+        self.grab_set()
+
+    def hide(self) -> None:
+        """
+        Hides the window and releases the input grab, keeping the widgets for the next use.
+        """
+        self.grab_release()
+        self.withdraw()
+
+    def schedule_filter(self, event=None) -> None:
+        """
+        Applies the filter once the user stops typing for FILTER_DELAY milliseconds.
+        """
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(FILTER_DELAY, self.update_log_display)
     
     def update_log_display(self) -> None:
         """
-        Updates the text display with the current error logs.
-        Clears the existing display and shows either the logs or a message if no logs exist.
-        Each log entry shows timestamp, type, message and details.
+        Reads the logs again, applying the filter, and shows the first page.
+        Entries are only read from the log as the pages that need them are shown.
+        """
+        self._filter_job = None
+        query = self.filter_entry.get().strip().casefold()
+        entries = self.error_log.get_logs()
+        if query:
+            entries = (entry for entry in entries if entry.matches(query))
+        self._entries = entries
+        self._loaded = []
+        self.show_page(0)
+
+    def show_page(self, page: int) -> None:
+        """
+        Formats the entries of a page and shows them with a single insert.
+        One entry past the page is read, to know whether there is a next page.
+
+        Args:
+            page (int): Index of the page, starting at 0
         """
+        page = max(page, 0)
+        start = page * LOG_PAGE_SIZE
+        end = start + LOG_PAGE_SIZE
+        if len(self._loaded) <= end:
+            self._loaded.extend(islice(self._entries, end + 1 - len(self._loaded)))
+        if page > 0 and start >= len(self._loaded):
+            return
+        self.page = page
+
+        entries = self._loaded[start:end]
         self.log_text.delete("1.0", "end")
-        logs = self.error_log.get_logs()
-        
-        if not logs:
+        if entries:
+            self.log_text.insert("1.0", "".join(entry.format() for entry in entries))
+        elif self.filter_entry.get().strip():
+            self.log_text.insert("1.0", "Nenhum erro corresponde ao filtro.")
+        else:
             self.log_text.insert("1.0", "Nenhum erro registrado.")
-            return
-        
-        for log in logs:
-            log_entry = (
-                f"[{log['timestamp']}] {log['type']}\n"
-                f"Mensagem: {log['short_message']}\n"
-                f"Detalhes: {log['detailed_message']}\n"
-                f"{'-' * 60}\n\n"
-            )
-            self.log_text.insert("end", log_entry)
+
+        has_next = len(self._loaded) > end
+        self.page_label.configure(text=f"Página {page + 1}" if entries else "")
+        self.previous_button.configure(state="normal" if page > 0 else "disabled")
+        self.next_button.configure(state="normal" if has_next else "disabled")
     
     def clear_logs(self) -> None:
         """
@@ -153,4 +190,4 @@ class LogWindow(ctk.CTkToplevel):
         Removes all logs from the ErrorLog instance and refreshes the window to show empty state.
         """
         self.error_log.clear_logs()
-        self.update_log_display()
\ No newline at end of file
+        self.update_log_display()
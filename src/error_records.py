@@ -0,0 +1,176 @@
+import os
+import time
+
+MAX_ERROR_SAMPLES = 100
+
+MOVE = "move"
+RESTORE = "restore"
+
+PERMISSION = "permission"
+EXISTS = "exists"
+NOT_FOUND = "not_found"
+OS_ERROR = "os_error"
+UNEXPECTED = "unexpected"
+
+KIND_LABELS = {
+    PERMISSION: "Sem permissão",
+    EXISTS: "Arquivo já existe",
+    NOT_FOUND: "Arquivo não encontrado",
+    OS_ERROR: "Erro do sistema",
+    UNEXPECTED: "Erro inesperado",
+}
+
+
+class ErrorRecord:
+    """
+    A compact record of an error on a single file.
+
+    Only the error kind, its errno, the path and a raw timestamp are stored; the
+    message shown to the user is built by format, when the error is displayed. The
+    exception text is only kept when it can't be rebuilt from the errno.
+
+    Attributes:
+        operation (str): What was being done to the file (MOVE or RESTORE).
+        kind (str): The error category, such as PERMISSION.
+        code (int | None): The errno of the error, if any.
+        path (str): Path of the file.
+        timestamp (float): When the error happened, as returned by time.time().
+        detail (str | None): The exception text, when it differs from the errno description.
+
+    Methods:
+        from_exception: Build a record from the exception raised for a file.
+        format: Format the message shown to the user.
+    """
+    __slots__ = ("operation", "kind", "code", "path", "timestamp", "detail")
+
+    def __init__(self, operation: str, kind: str, code: int | None, path: str, timestamp: float, detail: str | None = None):
+        self.operation = operation
+        self.kind = kind
+        self.code = code
+        self.path = path
+        self.timestamp = timestamp
+        self.detail = detail
+
+    @classmethod
+    def from_exception(cls, operation: str, path: str, error: Exception) -> "ErrorRecord":
+        """
+        Build a record from the exception raised for a file.
+
+        Args:
+            operation (str): What was being done to the file (MOVE or RESTORE).
+            path (str): Path of the file.
+            error (Exception): The exception.
+
+        Returns:
+            ErrorRecord: The record.
+        """
+        if isinstance(error, PermissionError):
+            kind = PERMISSION
+        elif isinstance(error, FileExistsError):
+            kind = EXISTS
+        elif isinstance(error, FileNotFoundError):
+            kind = NOT_FOUND
+        elif isinstance(error, OSError):
+            kind = OS_ERROR
+        else:
+            kind = UNEXPECTED
+
+        code = getattr(error, "errno", None)
+        if code and error.strerror == os.strerror(code):
+            detail = None
+        else:
+            detail = str(error)
+        return cls(operation, kind, code, path, time.time(), detail)
+
+    def format(self) -> str:
+        """
+        Format the message shown to the user.
+
+        Returns:
+            str: The message, in the same wording the organizer always used.
+        """
+        reason = self.detail if self.detail is not None else f"[Errno {self.code}] {os.strerror(self.code)}"
+        if self.operation == RESTORE:
+            return f"Não foi possível restaurar o arquivo {self.path}: {reason}"
+        if self.kind == PERMISSION:
+            return f"Sem permissão para mover o arquivo {self.path}"
+        return f"Ocorreu um erro ao tentar mover o arquivo {self.path}: {reason}"
+
+    def __str__(self) -> str:
+        return self.format()
+
+    def __repr__(self) -> str:
+        return f"ErrorRecord({self.operation!r}, {self.kind!r}, {self.code!r}, {self.path!r})"
+
+
+class ErrorSummary:
+    """
+    The errors of a run, aggregated by kind, with a bounded number of detailed samples.
+
+    Every error is counted, but only the first max_samples records are kept, so a run
+    where every file fails uses the same memory as one with a few errors. Iterating
+    over a summary yields the kept records.
+
+    Attributes:
+        max_samples (int): Maximum number of records kept.
+        samples (list[ErrorRecord]): The records kept, in the order they happened.
+        counts (dict[str, int]): Number of errors of each kind.
+        total (int): Number of errors, including the ones without a sample.
+
+    Methods:
+        add: Count an error, keeping its record if there is room.
+        merge: Add the counts and samples of another summary.
+        format_counts: Format the number of errors of each kind.
+    """
+
+    def __init__(self, max_samples: int = MAX_ERROR_SAMPLES):
+        self.max_samples = max_samples
+        self.samples: list[ErrorRecord] = []
+        self.counts: dict[str, int] = {}
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self.total
+
+    def __iter__(self):
+        return iter(self.samples)
+
+    @property
+    def omitted(self) -> int:
+        """
+        Number of errors counted without a sample.
+        """
+        return self.total - len(self.samples)
+
+    def add(self, record: ErrorRecord) -> None:
+        """
+        Count an error, keeping its record if there is room.
+
+        Args:
+            record (ErrorRecord): The error.
+        """
+        self.total += 1
+        self.counts[record.kind] = self.counts.get(record.kind, 0) + 1
+        if len(self.samples) < self.max_samples:
+            self.samples.append(record)
+
+    def merge(self, other: "ErrorSummary") -> None:
+        """
+        Add the counts and samples of another summary, up to max_samples.
+
+        Args:
+            other (ErrorSummary): The summary to be merged.
+        """
+        self.total += other.total
+        for kind, count in other.counts.items():
+            self.counts[kind] = self.counts.get(kind, 0) + count
+        self.samples.extend(other.samples[:self.max_samples - len(self.samples)])
+
+    def format_counts(self) -> list[str]:
+        """
+        Format the number of errors of each kind, most frequent first.
+
+        Returns:
+            list[str]: One line per kind, such as "Sem permissão: 500000".
+        """
+        return [f"{KIND_LABELS.get(kind, kind)}: {count}" for kind, count in sorted(self.counts.items(), key=lambda item: -item[1])]
@@ -0,0 +1,135 @@
+import errno
+import os
+import shutil
+
+COPY_CHUNK_SIZE = 8 * 1024 * 1024
+FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.ENOTSUP, errno.ENOTSOCK}
+
+
+class FileMover:
+    """
+    A class for moving files that works across filesystems.
+
+    Files are renamed when the source and destination folders are on the same device.
+    When they are not (for example, when a destination folder is a symbolic link or a
+    mount point for another volume), the file is copied in kernel space with
+    os.copy_file_range or os.sendfile, the copy is verified, and only then the source
+    is removed. The device of each folder is looked up once and cached.
+
+    Attributes:
+        devices (dict[str, int]): Cache mapping folder paths to their st_dev.
+
+    Methods:
+        is_same_device: Check whether two folders are on the same device.
+        move: Move a file to a new path.
+    """
+
+    def __init__(self):
+        self.devices: dict[str, int] = {}
+
+    def _get_device(self, folder: str) -> int:
+        device = self.devices.get(folder)
+        if device is None:
+            device = self.devices[folder] = os.stat(folder).st_dev
+        return device
+
+    def is_same_device(self, source_folder: str, destination_folder: str) -> bool:
+        """
+        Check whether two folders are on the same device.
+
+        Args:
+            source_folder (str): The folder the file is moved from.
+            destination_folder (str): The folder the file is moved to.
+
+        Returns:
+            bool: True if both folders are on the same device, False otherwise.
+        """
+        return self._get_device(source_folder) == self._get_device(destination_folder)
+
+    def move(self, source: str | os.PathLike, destination: str | os.PathLike) -> None:
+        """
+        Move a file to a new path.
+
+        The rename is tried first whenever both folders are on the same device; if it
+        still fails with EXDEV (as with bind mounts), the copy fallback is used.
+
+        Args:
+            source (str | os.PathLike): Path of the file to be moved.
+            destination (str | os.PathLike): New path of the file.
+
+        Raises:
+            FileExistsError: If the destination exists and the file had to be copied.
+            OSError: If the file could not be moved.
+        """
+        source = os.fspath(source)
+        destination = os.fspath(destination)
+
+        if self.is_same_device(os.path.dirname(source), os.path.dirname(destination)):
+            try:
+                os.rename(source, destination)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+
+        self._copy_and_unlink(source, destination)
+
+    def _copy_and_unlink(self, source: str, destination: str) -> None:
+        with open(source, "rb") as source_file:
+            size = os.fstat(source_file.fileno()).st_size
+            with open(destination, "xb") as destination_file:
+                try:
+                    copy_file_contents(source_file, destination_file, size)
+                    copied_size = os.fstat(destination_file.fileno()).st_size
+                    if copied_size != size:
+                        raise OSError(errno.EIO, f"Cópia incompleta ({copied_size} de {size} bytes)", destination)
+                except BaseException:
+                    destination_file.close()
+                    os.unlink(destination)
+                    raise
+
+        try:
+            shutil.copystat(source, destination)
+            os.unlink(source)
+        except BaseException:
+            os.unlink(destination)
+            raise
+
+
+def copy_file_contents(source_file, destination_file, size: int) -> None:
+    """
+    Copy the contents of a file without passing through Python-level buffers.
+
+    os.copy_file_range is used when available, then os.sendfile; shutil.copyfileobj
+    is only used on platforms that support neither.
+
+    Args:
+        source_file: The source file object, opened for binary reading.
+        destination_file: The destination file object, opened for binary writing.
+        size (int): Number of bytes to be copied.
+    """
+    source_fd = source_file.fileno()
+    destination_fd = destination_file.fileno()
+
+    for copy_function in (getattr(os, "copy_file_range", None), _sendfile):
+        if copy_function is None:
+            continue
+        offset = 0
+        try:
+            while offset < size:
+                copied = copy_function(source_fd, destination_fd, min(COPY_CHUNK_SIZE, size - offset), offset)
+                if not copied:
+                    break
+                offset += copied
+            return
+        except OSError as e:
+            if e.errno not in FALLBACK_ERRNOS or offset:
+                raise
+
+    shutil.copyfileobj(source_file, destination_file, COPY_CHUNK_SIZE)
+
+
+def _sendfile(source_fd: int, destination_fd: int, count: int, offset: int) -> int:
+    if not hasattr(os, "sendfile"):
+        raise OSError(errno.ENOSYS, "sendfile indisponível")
+    return os.sendfile(destination_fd, source_fd, offset, count)
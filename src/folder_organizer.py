@@ -1,6 +1,23 @@
 from pathlib import Path
-from sys import argv
+from sys import argv, stderr
+from collections import OrderedDict, deque
+from threading import Event, Lock, Timer
+from itertools import islice
+from time import perf_counter
+from typing import Callable, Iterable, Iterator, NamedTuple
+from content_detector import ContentDetector
+from file_mover import FileMover
+from move_journal import MoveJournal, JOURNAL_FILE_NAME
+from rule_engine import RuleEngine
+from mapping_store import MappingStore
+from error_records import ErrorRecord, ErrorSummary, MAX_ERROR_SAMPLES, MOVE
+from error_log import ErrorLog
+from run_stats import RunStats, SCAN, CLASSIFY, MKDIR, INDEX, RESERVE, RENAME, JOURNAL, TOTAL, FILES, MOVED, COLLISIONS, RETRIES, ERRORS
+import argparse
+import atexit
 import csv
+import marshal
+import os
 
 DEFAULT_EXTENSION_TO_TYPE = {
     ".txt": "Texto", ".md": "Texto", ".csv": "Texto", ".log": "Texto",
@@ -34,114 +51,817 @@ DEFAULT_EXTENSION_TO_TYPE = {
 }
 
 DATA_PATH = Path(__file__).parent.parent / "data.csv"
+SNAPSHOT_PATH = DATA_PATH.with_name("data.cache")
+SNAPSHOT_VERSION = 1
+SAVE_DELAY = 1.0
+PLAN_BATCH_SIZE = 10_000
+DEFAULT_WORKERS = 1
+MAX_COLLISION_COUNTERS = 4096
 EXTENSION_FIELDNAME = "File extension"
 FILE_TYPE_FIELDNAME = "File Type"
 
+class ScannedFile(NamedTuple):
+    """
+    A compact entry produced by the directory scanner.
+
+    Attributes:
+        name (str): The file name, including its extension.
+        path (str): The full path of the file.
+        stat (os.stat_result | None): The stat of the file, if requested from the scanner.
+    """
+    name: str
+    path: str
+    stat: os.stat_result | None = None
+
+
+def scan_files(directory: str | os.PathLike, with_stat: bool = False) -> Iterator[ScannedFile]:
+    """
+    Scan a directory and yield the regular files it contains.
+
+    The directory is opened immediately, so errors such as FileNotFoundError or
+    NotADirectoryError are raised by this call and not by the first iteration.
+    Entry types come from the DirEntry objects returned by os.scandir, which avoids
+    an extra stat call per file on most platforms.
+
+    Args:
+        directory (str | os.PathLike): Path of the directory to be scanned.
+        with_stat (bool, optional): Whether each entry carries its stat, taken from
+            the DirEntry (free on Windows, one call per file elsewhere). Defaults to False.
+
+    Returns:
+        Iterator[ScannedFile]: An iterator over the files found in the directory.
+    """
+    iterator = os.scandir(directory)
+
+    def generate() -> Iterator[ScannedFile]:
+        with iterator:
+            for entry in iterator:
+                try:
+                    if entry.is_file():
+                        yield ScannedFile(entry.name, entry.path, entry.stat() if with_stat else None)
+                except OSError:
+                    continue
+
+    return generate()
+
+
+def walk_files(directory: str | os.PathLike, max_depth: int | None = None, excluded_folders: Iterable[str] = (), with_stat: bool = False) -> Iterator[ScannedFile]:
+    """
+    Walk a directory tree and yield the regular files it contains.
+
+    The walk is a generator: directories are opened one at a time and only the
+    paths of the subdirectories still to be visited are kept in memory, so memory
+    usage doesn't depend on the number of files in the tree. Symbolic links to
+    directories are not followed. As in scan_files, the top directory is opened
+    immediately so errors are raised by this call.
+
+    Args:
+        directory (str | os.PathLike): Path of the directory to be walked.
+        max_depth (int | None, optional): Maximum number of levels to descend below
+            the directory. None means no limit. Defaults to None.
+        excluded_folders (Iterable[str], optional): Names of folders, directly inside
+            the directory, that must not be visited. Defaults to ().
+        with_stat (bool, optional): Whether each entry carries its stat. Defaults to False.
+
+    Returns:
+        Iterator[ScannedFile]: An iterator over the files found in the tree.
+    """
+    iterator = os.scandir(directory)
+    excluded_folders = {os.path.normcase(name) for name in excluded_folders}
+
+    def generate() -> Iterator[ScannedFile]:
+        current_iterator = iterator
+        depth = 0
+        pending_folders = []
+
+        while True:
+            descend = max_depth is None or depth < max_depth
+            with current_iterator:
+                for entry in current_iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if descend and not (depth == 0 and os.path.normcase(entry.name) in excluded_folders):
+                                pending_folders.append((entry.path, depth + 1))
+                        elif entry.is_file():
+                            yield ScannedFile(entry.name, entry.path, entry.stat() if with_stat else None)
+                    except OSError:
+                        continue
+
+            while pending_folders:
+                folder_path, depth = pending_folders.pop()
+                try:
+                    current_iterator = os.scandir(folder_path)
+                    break
+                except OSError:
+                    continue
+            else:
+                return
+
+    return generate()
+
+
+class MoveEvent(NamedTuple):
+    """
+    A file was moved.
+
+    Attributes:
+        source (str): Path the file was moved from.
+        destination (str): Path the file was moved to.
+        file_type (str): The file type (destination folder) of the file.
+    """
+    source: str
+    destination: str
+    file_type: str
+
+
+class ErrorEvent(NamedTuple):
+    """
+    A file could not be moved.
+
+    Attributes:
+        source (str): Path of the file.
+        record (ErrorRecord): The compact record of the error.
+    """
+    source: str
+    record: ErrorRecord
+
+    @property
+    def message(self) -> str:
+        """
+        The error message shown to the user, formatted on access.
+        """
+        return self.record.format()
+
+
+OrganizeEvent = MoveEvent | ErrorEvent
+
+
+class MovePlan:
+    """
+    A complete move plan for a directory, grouped by destination folder.
+
+    Attributes:
+        directory (Path): The directory being organized.
+        moves (dict[str, list[ScannedFile]]): Files to be moved, grouped by file type.
+
+    Methods:
+        add: Add a file to the plan.
+        summary: Return the number of files planned for each file type.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.moves: dict[str, list[ScannedFile]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(files) for files in self.moves.values())
+
+    def add(self, file_type: str, file: ScannedFile) -> None:
+        """
+        Add a file to the plan.
+
+        Args:
+            file_type (str): The destination file type (folder name).
+            file (ScannedFile): The file to be moved.
+        """
+        files = self.moves.get(file_type)
+        if files is None:
+            files = self.moves[file_type] = []
+        files.append(file)
+
+    def summary(self) -> dict[str, int]:
+        """
+        Return the number of files planned for each file type.
+
+        Returns:
+            dict[str, int]: Dictionary mapping file types to file counts.
+        """
+        return {file_type: len(files) for file_type, files in self.moves.items()}
+
+
+class DestinationIndex:
+    """
+    An index of the name collisions in a destination folder.
+
+    The folder is never listed: a name is confirmed free with a single lstat, so memory
+    stays flat however many files the folder holds or receives. Only collisions are
+    indexed, as the next counter to try for each (stem, suffix), so a name that keeps
+    colliding skips the numbered names already handed out; the MAX_COLLISION_COUNTERS
+    most recently used counters are kept. The last in_flight names handed out by reserve
+    are remembered too, since their files may not have been moved into the folder yet.
+    Names are compared with os.path.normcase, which makes the index case-insensitive on
+    Windows. Reservations are thread-safe.
+
+    Attributes:
+        folder (Path): The destination folder.
+        in_flight (int): Maximum number of reserved names whose files may still be on the way.
+        next_counters (OrderedDict[tuple[str, str], int]): Next counter to try for each
+            (stem, suffix), least recently used first.
+
+    Methods:
+        reserve: Reserve a unique file name in the folder.
+    """
+
+    def __init__(self, folder: Path, in_flight: int = 1):
+        self.folder = folder
+        self.in_flight = in_flight
+        self.next_counters: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._recent: deque[str] = deque()
+        self._recent_names: set[str] = set()
+        self._lock = Lock()
+
+    def reserve(self, file_name: str) -> str:
+        """
+        Reserve a unique file name in the folder.
+
+        The original name is returned when it is free, otherwise a name in the
+        "stem(counter).suffix" format is generated.
+
+        Args:
+            file_name (str): The original file name.
+
+        Returns:
+            str: A file name that doesn't exist in the folder.
+        """
+        with self._lock:
+            return self._reserve(file_name)
+
+    def _is_taken(self, file_name: str) -> bool:
+        return os.path.normcase(file_name) in self._recent_names or os.path.lexists(os.path.join(self.folder, file_name))
+
+    def _remember(self, file_name: str) -> None:
+        key = os.path.normcase(file_name)
+        if key in self._recent_names:
+            return
+        if len(self._recent) >= self.in_flight:
+            self._recent_names.discard(self._recent.popleft())
+        self._recent.append(key)
+        self._recent_names.add(key)
+
+    def _reserve(self, file_name: str) -> str:
+        if not self._is_taken(file_name):
+            self._remember(file_name)
+            return file_name
+
+        original_name = Path(file_name)
+        stem = original_name.stem
+        suffix = original_name.suffix
+        counter_key = (os.path.normcase(stem), os.path.normcase(suffix))
+        counter = self.next_counters.pop(counter_key, 1)
+
+        new_name = f"{stem}({counter}){suffix}"
+        while self._is_taken(new_name):
+            counter += 1
+            new_name = f"{stem}({counter}){suffix}"
+
+        self.next_counters[counter_key] = counter + 1
+        if len(self.next_counters) > MAX_COLLISION_COUNTERS:
+            self.next_counters.popitem(last=False)
+        self._remember(new_name)
+        return new_name
+
+
+class SuffixClassifier:
+    """
+    A compiled extension mapping that supports multi-dot extensions such as ".tar.gz".
+
+    Extensions are stored lowercased in a dictionary. The last part of every multi-dot
+    extension (".gz" for ".tar.gz") is also kept in a set, so a name whose last suffix
+    can't end a multi-dot extension is classified with one rfind and one dictionary
+    lookup, just like Path.suffix. The other names lowercase their candidate tail (the
+    last max_dots dotted parts) once and try the candidate suffixes from the longest to
+    the shortest, so the most specific extension wins.
+
+    Attributes:
+        suffixes (dict[str, str]): Dictionary mapping lowercased extensions to file types.
+        multi_dot_tails (set[str]): Last parts of the mapped multi-dot extensions.
+        max_dots (int): Largest number of dots in a mapped extension.
+
+    Methods:
+        classify: Get the file type mapped to the longest matching extension of a name.
+    """
+
+    def __init__(self, file_type_dict: dict[str, str]):
+        self.suffixes: dict[str, str] = {}
+        self.multi_dot_tails: set[str] = set()
+        self.max_dots = 1
+        for extension, file_type in file_type_dict.items():
+            if extension == "others":
+                continue
+            extension = extension.lower()
+            self.suffixes[extension] = file_type
+            dots = extension.count(".")
+            if dots > 1:
+                self.multi_dot_tails.add(extension[extension.rfind("."):])
+                self.max_dots = max(self.max_dots, dots)
+
+    def classify(self, file_name: str) -> str | None:
+        """
+        Get the file type mapped to the longest matching extension of a name.
+
+        As with Path.suffix, a leading dot (hidden files) or a trailing dot doesn't
+        start an extension.
+
+        Args:
+            file_name (str): The name of the file.
+
+        Returns:
+            str | None: The file type, or None if no extension of the name is mapped.
+        """
+        start = file_name.rfind(".")
+        if start <= 0 or start == len(file_name) - 1:
+            return None
+        suffix = file_name[start:].lower()
+        if suffix in self.multi_dot_tails:
+            previous_dot = file_name.rfind(".", 0, start)
+            if previous_dot > 0:
+                return self._classify_multi_dot(file_name, previous_dot)
+        return self.suffixes.get(suffix)
+
+    def _classify_multi_dot(self, file_name: str, start: int) -> str | None:
+        for _ in range(self.max_dots - 2):
+            dot_index = file_name.rfind(".", 0, start)
+            if dot_index <= 0:
+                break
+            start = dot_index
+
+        tail = file_name[start:].lower()
+        while True:
+            file_type = self.suffixes.get(tail)
+            if file_type is not None:
+                return file_type
+            dot_index = tail.find(".", 1)
+            if dot_index < 0:
+                return None
+            tail = tail[dot_index:]
+
+
+def write_csv_atomically(path: Path, rows: Iterable[tuple[str, str]]) -> None:
+    """
+    Write the extension mappings to a CSV file without ever leaving it half written.
+
+    The rows are written to a temporary file next to it, synced to disk and then
+    renamed over the file, so a crash leaves either the old or the new file.
+
+    Args:
+        path (Path): Path of the CSV file.
+        rows (Iterable[tuple[str, str]]): The (extension, file type) pairs.
+
+    Raises:
+        OSError: If the file can't be written; the old file is kept.
+    """
+    temporary_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(temporary_path, "w", newline="", encoding="utf-8") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow([EXTENSION_FIELDNAME, FILE_TYPE_FIELDNAME])
+            writer.writerows(rows)
+            csv_file.flush()
+            os.fsync(csv_file.fileno())
+        os.replace(temporary_path, path)
+    except BaseException:
+        try:
+            os.unlink(temporary_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_default_csv() -> str | None:
+    """
+    Save the default extension dictionary to the CSV file.
+
+    Returns:
+        str | None: Error message if there's an error, None otherwise
+    """
+    try:
+        write_csv_atomically(DATA_PATH, DEFAULT_EXTENSION_TO_TYPE.items())
+        return None
+    except PermissionError:
+        return "Permissão negada para escrever no arquivo CSV. O arquivo padrão será utilizado."
+    except Exception as e:
+        return f"Ocorreu um erro ao tentar escrever no arquivo CSV: {e}\nO arquivo padrão será utilizado."
+
+
+def read_csv_mapping() -> tuple[dict[str, str], str | None]:
+    """
+    Read the extension dictionary from the CSV file.
+
+    A missing file is created with the default mappings, and an invalid file is
+    overwritten with them.
+
+    Returns:
+        tuple[dict[str, str], str | None]: A tuple containing:
+            - dict[str, str]: Dictionary mapping file extensions to file types.
+            - str | None: Error message if any, None otherwise.
+    """
+    file_type_dict = {}
+    error_msg = None
+    
+    try:
+        with open(DATA_PATH, "r", newline="", encoding="utf-8") as csv_file:
+            reader = csv.DictReader(csv_file)
+            for row in reader:
+                extension = row[EXTENSION_FIELDNAME].strip().lower()
+                file_type = row[FILE_TYPE_FIELDNAME].strip()
+                if extension and file_type:
+                    file_type_dict[extension] = file_type
+    except FileNotFoundError:
+        csv_error = write_default_csv()
+        return DEFAULT_EXTENSION_TO_TYPE, csv_error
+    except:
+        error_msg = "Erro com o arquivo CSV. O arquivo será sobreescrito com os dados padrões."
+        csv_error = write_default_csv()
+        if csv_error:
+            return DEFAULT_EXTENSION_TO_TYPE, csv_error
+        return DEFAULT_EXTENSION_TO_TYPE, error_msg
+                    
+    return file_type_dict, error_msg
+
+
+class MappingCache:
+    """
+    A process-wide cache of the compiled extension mapping.
+
+    The mapping is parsed from the CSV file once and kept as a MappingStore, with its
+    compiled SuffixClassifier. Each access only stats the CSV file: the cache is reused while
+    its modification time and size don't change. A binary snapshot (marshal) of the
+    parsed mapping is also kept next to the CSV file, so a new process skips CSV
+    parsing when the file didn't change since the snapshot was written.
+
+    Edits are written behind: save keeps the new mappings and (re)starts a timer, so
+    a burst of edits ends in a single atomic write, save_delay seconds after the last
+    one. Pending mappings are written before the next get, on flush and at exit. Errors
+    of the timed write are passed to on_save_error, and those at exit are printed.
+
+    Attributes:
+        data_path (Path): Path of the CSV file.
+        snapshot_path (Path): Path of the binary snapshot.
+        loader (Callable[[], tuple[dict[str, str], str | None]]): Parses the CSV file.
+        save_delay (float): Seconds without edits before pending mappings are written.
+        on_save_error (Callable[[str], None] | None): Called with the error message when
+            the timed write fails, from the timer thread.
+
+    Methods:
+        get: Get the mapping store and its classifier, reloading them if the file changed.
+        save: Schedule the mappings to be written to the CSV file.
+        flush: Write the pending mappings now.
+        invalidate: Forget the cached mapping.
+        export: Get the state of the cache, to be preloaded in another process.
+        preload: Fill the cache with a state exported by another process.
+    """
+
+    def __init__(self, data_path: Path = DATA_PATH, snapshot_path: Path = SNAPSHOT_PATH, loader: Callable[[], tuple[dict[str, str], str | None]] = read_csv_mapping, save_delay: float = SAVE_DELAY):
+        self.data_path = data_path
+        self.snapshot_path = snapshot_path
+        self.loader = loader
+        self.save_delay = save_delay
+        self.on_save_error: Callable[[str], None] | None = None
+        self._signature: tuple[int, int] | None = None
+        self._mapping: tuple[MappingStore, SuffixClassifier] | None = None
+        self._pending: list[tuple[str, str]] | None = None
+        self._timer: Timer | None = None
+        self._exit_registered = False
+        self._lock = Lock()
+
+    def _get_signature(self) -> tuple[int, int] | None:
+        try:
+            file_stat = os.stat(self.data_path)
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def get(self) -> tuple[MappingStore, SuffixClassifier, str | None]:
+        """
+        Get the mapping store and its classifier, reloading them if the file changed.
+
+        The returned store is shared and must not be modified; copy it to edit it.
+
+        Returns:
+            tuple[MappingStore, SuffixClassifier, str | None]: A tuple containing:
+                - MappingStore: The extension to file type mappings.
+                - SuffixClassifier: The compiled mapping.
+                - str | None: Error message if the CSV file had to be recreated or the
+                  pending mappings couldn't be saved, None otherwise.
+        """
+        with self._lock:
+            save_error = self._flush_pending()
+            signature = self._get_signature()
+            if signature is not None and signature == self._signature:
+                return (*self._mapping, save_error)
+
+            file_type_dict = self._read_snapshot(signature)
+            error_msg = None
+            if file_type_dict is None:
+                file_type_dict, error_msg = self.loader()
+                signature = self._get_signature()
+                if signature is not None:
+                    self._write_snapshot(signature, file_type_dict)
+
+            self._signature = signature
+            self._mapping = (MappingStore(file_type_dict.items()), SuffixClassifier(file_type_dict))
+            return (*self._mapping, error_msg or save_error)
+
+    def save(self, rows: Iterable[tuple[str, str]]) -> None:
+        """
+        Schedule the mappings to be written to the CSV file.
+
+        The rows are copied, and written save_delay seconds after the last call, on
+        the next get or flush, or at exit, whichever comes first. Only the rows of
+        the last call are written.
+
+        Args:
+            rows (Iterable[tuple[str, str]]): The (extension, file type) pairs, such as
+                a MappingStore.
+        """
+        with self._lock:
+            self._pending = list(rows)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = Timer(self.save_delay, self._flush_behind)
+            self._timer.daemon = True
+            self._timer.start()
+            if not self._exit_registered:
+                atexit.register(self._flush_at_exit)
+                self._exit_registered = True
+
+    def flush(self) -> str | None:
+        """
+        Write the pending mappings now, if there are any.
+
+        Returns:
+            str | None: Error message if the file couldn't be written, None otherwise.
+                The mappings stay pending, to be retried by the next flush.
+        """
+        with self._lock:
+            return self._flush_pending()
+
+    def _flush_behind(self) -> None:
+        error_msg = self.flush()
+        if error_msg and self.on_save_error is not None:
+            self.on_save_error(error_msg)
+
+    def _flush_at_exit(self) -> None:
+        error_msg = self.flush()
+        if error_msg:
+            print(error_msg, file=stderr)
+
+    def _flush_pending(self) -> str | None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending is None:
+            return None
+        try:
+            write_csv_atomically(self.data_path, self._pending)
+        except OSError as e:
+            return f"Ocorreu um erro ao tentar salvar o arquivo CSV: {e}"
+        self._pending = None
+        self._signature = None
+        self._mapping = None
+        return None
+
+    def invalidate(self) -> None:
+        """
+        Forget the cached mapping, so the next access reads the file again.
+        """
+        with self._lock:
+            self._signature = None
+            self._mapping = None
+
+    def export(self) -> tuple[tuple[int, int] | None, dict[str, str]]:
+        """
+        Get the state of the cache, loading the mapping if needed.
+
+        Returns:
+            tuple[tuple[int, int] | None, dict[str, str]]: The (mtime_ns, size) signature of
+                the CSV file and the mapping, both picklable.
+        """
+        self.get()
+        with self._lock:
+            return self._signature, self._mapping[0].as_dict()
+
+    def preload(self, signature: tuple[int, int] | None, file_type_dict: dict[str, str]) -> None:
+        """
+        Fill the cache with a state exported by another process, so the CSV file isn't
+        parsed again while it keeps the same signature.
+
+        Args:
+            signature (tuple[int, int] | None): The signature returned by export.
+            file_type_dict (dict[str, str]): The mapping returned by export.
+        """
+        with self._lock:
+            self._signature = signature
+            self._mapping = (MappingStore(file_type_dict.items()), SuffixClassifier(file_type_dict))
+
+    def _read_snapshot(self, signature: tuple[int, int] | None) -> dict[str, str] | None:
+        if signature is None:
+            return None
+        try:
+            with open(self.snapshot_path, "rb") as snapshot_file:
+                version, snapshot_signature, file_type_dict = marshal.load(snapshot_file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return None
+        if version != SNAPSHOT_VERSION or tuple(snapshot_signature) != signature:
+            return None
+        return file_type_dict
+
+    def _write_snapshot(self, signature: tuple[int, int], file_type_dict: dict[str, str]) -> None:
+        temporary_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+        try:
+            with open(temporary_path, "wb") as snapshot_file:
+                marshal.dump((SNAPSHOT_VERSION, signature, dict(file_type_dict)), snapshot_file)
+            os.replace(temporary_path, self.snapshot_path)
+        except OSError:
+            pass
+
+
+MAPPING_CACHE = MappingCache()
+
+
+def load_mapping() -> tuple[MappingStore, SuffixClassifier, str | None]:
+    """
+    Get the extension mapping from the process-wide cache.
+
+    Returns:
+        tuple[MappingStore, SuffixClassifier, str | None]: A tuple containing:
+            - MappingStore: The extension to file type mappings, shared and read only.
+            - SuffixClassifier: The compiled mapping.
+            - str | None: Error message if any, None otherwise.
+    """
+    return MAPPING_CACHE.get()
+
+
 class FileOrganizer:
     """
     A class for organizing files in a directory based on their file extensions.
 
     This class provides functionality to:
-    1. Read file extension mappings from a CSV file or use default mappings.
+    1. Read file extension mappings from a CSV file (through the process-wide
+       MappingCache) or use default mappings.
     2. Organize files in a specified directory into subdirectories based on their types.
-    3. Handle file naming conflicts by creating unique file names.
+    3. Handle file naming conflicts by creating unique file names (see DestinationIndex).
 
     Attributes:
-        file_type_dict (dict[str, str]): A dictionary mapping file extensions to file types.
+        mapping (MappingStore): The extension to file type mappings, shared with the cache.
+        classifier (SuffixClassifier): The mapping compiled for classification.
+        workers (int): Number of threads used to move files.
+        file_mover (FileMover): Moves the files, also across filesystems.
+        journal (MoveJournal | None): Journal of the run in progress, if any.
+        recursive (bool): Whether files inside subfolders are organized too.
+        max_depth (int | None): Maximum subfolder depth in recursive mode (None for no limit).
+        content_detector (ContentDetector | None): Classifies files by their contents
+            when the extension lookup misses, if enabled.
         csv_error (str | None): An error message if there was an issue with the CSV file.
+        rule_engine (RuleEngine): Rules by size, age or name, applied before the extensions.
+        rules_error (str | None): An error message if there was an issue with the rules file.
+        stats (RunStats | None): Time and counters of each phase, if enabled.
+        max_error_samples (int): Maximum number of detailed error records kept per run.
+        on_progress (Callable[[int, int], None] | None): Called after each file with the
+            number of files processed and planned so far in the run, if set.
+        processed_files (int): Number of files processed (moved or failed) in the current run.
+        planned_files (int): Number of files planned so far in the current run.
+        cancel_event (Event): Event that stops the runs between two files when set; it
+            stays set, so a cancelled organizer doesn't start new runs.
 
     Methods:
-        get_unique_file_name: Generate a unique file name to avoid conflicts.
-        dict_to_csv: Save the extension dictionary to the CSV file.
-        csv_to_dict: Read the extension dictionary from the CSV file.
+        get_file_type: Get the file type (destination folder) for a file name.
+        get_file_types: Get all the file types (destination folders) in use.
+        dict_to_csv: Save the default extension dictionary to the CSV file.
+        csv_to_dict: Read the extension dictionary from the CSV file, bypassing the cache.
+        scan_folder: Validate a directory and start scanning its files.
+        plan_folder: Build the move plan for a directory without moving files.
+        iter_plans: Split a stream of files into bounded move plans.
+        execute_plan: Execute a move plan.
+        iter_execute_plan: Execute a move plan, yielding an event per file.
         organize_folder: Organize files in the specified directory.
+        iter_organize: Organize a directory, yielding an event per file.
+        collect_errors: Consume a stream of events, keeping only the errors.
+        organize_files: Organize only the given files of a directory.
+        undo_folder: Undo the last organization of a directory.
+        cancel: Ask the run in progress to stop.
+        cancelled: Whether the last run was cancelled.
     """
 
-    def __init__(self):
-        self.file_type_dict, self.csv_error = self.csv_to_dict()
+    def __init__(self, workers: int = DEFAULT_WORKERS, recursive: bool = False, max_depth: int | None = None, sniff_content: bool = False, collect_stats: bool = False, max_error_samples: int = MAX_ERROR_SAMPLES):
+        """
+        Initializes the FileOrganizer and loads the extension mappings.
 
-    def get_unique_file_name(self, destination_folder: Path, original_name: Path) -> str:
+        Args:
+            workers (int, optional): Number of threads used to move files. Defaults to
+                DEFAULT_WORKERS (1, serial).
+            recursive (bool, optional): Whether subfolders are organized too. Defaults to False.
+            max_depth (int | None, optional): Maximum subfolder depth in recursive mode.
+                None means no limit. Defaults to None.
+            sniff_content (bool, optional): Whether files with unmapped extensions are
+                classified by their contents. Defaults to False.
+            collect_stats (bool, optional): Whether the time and counters of each phase
+                are collected in a RunStats. Defaults to False.
+            max_error_samples (int, optional): Maximum number of detailed error records
+                kept per run; further errors are only counted. Defaults to MAX_ERROR_SAMPLES.
         """
-        Generate a unique file name to avoid conflicts in the destination folder.
+        self.workers = workers
+        self.file_mover = FileMover()
+        self.journal: MoveJournal | None = None
+        self.recursive = recursive
+        self.max_depth = max_depth
+        self.content_detector = ContentDetector() if sniff_content else None
+        self.stats = RunStats() if collect_stats else None
+        self.max_error_samples = max_error_samples
+        self.on_progress: Callable[[int, int], None] | None = None
+        self.processed_files = 0
+        self.planned_files = 0
+        self.cancel_event = Event()
+        self.mapping, self.classifier, self.csv_error = load_mapping()
+        self.rule_engine, self.rules_error = RuleEngine.from_csv()
+
+    def get_file_type(self, file_name: str, file_path: str | None = None, file_stat: os.stat_result | None = None) -> str:
+        """
+        Get the file type (destination folder) for a file.
+
+        Rules from the rules file are checked first. Then the longest mapped extension
+        of the name is used, so ".tar.gz" takes precedence over ".gz". Dots follow the
+        same rules as Path.suffix, so hidden files such as ".bashrc" have no extension.
+        When the extension isn't mapped and content detection is enabled, the first
+        bytes of the file are used to find its real extension.
 
         Args:
-            destination_folder (Path): The folder where the file will be moved.
-            original_name (Path): The original file name.
+            file_name (str): The name of the file.
+            file_path (str | None, optional): The path of the file, needed for content
+                detection and, without file_stat, for size and age rules. Defaults to None.
+            file_stat (os.stat_result | None, optional): The stat of the file, as
+                returned by the scan. Defaults to None.
 
         Returns:
-            str: A unique file name that doesn't exist in the destination folder.
+            str: The file type for the file, or the "others" type.
         """
-        stem = original_name.stem
-        suffix = original_name.suffix
-        new_name = original_name.name
-        counter = 1
+        if self.rule_engine:
+            if file_stat is None and file_path is not None and self.rule_engine.needs_stat:
+                try:
+                    file_stat = os.stat(file_path)
+                except OSError:
+                    pass
+            file_type = self.rule_engine.match(file_name, file_stat)
+            if file_type:
+                return file_type
 
-        while (destination_folder / new_name).exists():
-            new_name = f"{stem}({counter}){suffix}"
-            counter += 1
-        return new_name
+        file_type = self.classifier.classify(file_name)
+        if file_type:
+            return file_type
+
+        if self.content_detector is not None and file_path is not None:
+            extension = self.content_detector.detect(file_path, file_stat)
+            if extension is not None and extension in self.mapping:
+                return self.mapping.get(extension)
+        return self.mapping.get("others", "Others")
+
+    def get_file_types(self) -> set[str]:
+        """
+        Get all the file types (destination folders) in use.
+
+        Returns:
+            set[str]: The file types, including the one used for unmapped extensions.
+        """
+        file_types = self.mapping.file_types()
+        file_types.update(self.rule_engine.file_types)
+        file_types.add(self.mapping.get("others", "Others"))
+        return file_types
 
     def dict_to_csv(self) -> str | None:
         """
-        Save the extension dictionary to the CSV file.
+        Save the default extension dictionary to the CSV file.
         
         Returns:
             str | None: Error message if there's an error, None otherwise
         """
-        try:
-            with open(DATA_PATH, "w", newline="", encoding="utf-8") as csv_file:
-                writer = csv.writer(csv_file)
-                writer.writerow([EXTENSION_FIELDNAME, FILE_TYPE_FIELDNAME])
-                writer.writerows(DEFAULT_EXTENSION_TO_TYPE.items())
-            return None
-        except PermissionError:
-            return "Permissão negada para escrever no arquivo CSV. O arquivo padrão será utilizado."
-        except Exception as e:
-            return f"Ocorreu um erro ao tentar escrever no arquivo CSV: {e}\nO arquivo padrão será utilizado."
+        return write_default_csv()
 
     def csv_to_dict(self) -> tuple[dict[str, str], str | None]:
         """
-        Read the extension dictionary from the CSV file.
+        Read the extension dictionary from the CSV file, bypassing the mapping cache.
     
         Returns:
             tuple[dict[str, str], str | None]: A tuple containing:
                 - dict[str, str]: Dictionary mapping file extensions to file types.
                 - str | None: Error message if any, None otherwise.
         """
-        file_type_dict = {}
-        error_msg = None
-        
-        try:
-            with open(DATA_PATH, "r", newline="", encoding="utf-8") as csv_file:
-                reader = csv.DictReader(csv_file)
-                for row in reader:
-                    extension = row[EXTENSION_FIELDNAME].strip().lower()
-                    file_type = row[FILE_TYPE_FIELDNAME].strip()
-                    if extension and file_type:
-                        file_type_dict[extension] = file_type
-        except FileNotFoundError:
-            csv_error = self.dict_to_csv()
-            return DEFAULT_EXTENSION_TO_TYPE, csv_error
-        except:
-            error_msg = "Erro com o arquivo CSV. O arquivo será sobreescrito com os dados padrões."
-            csv_error = self.dict_to_csv()
-            if csv_error:
-                return DEFAULT_EXTENSION_TO_TYPE, csv_error
-            return DEFAULT_EXTENSION_TO_TYPE, error_msg
-                        
-        return file_type_dict, error_msg
+        return read_csv_mapping()
 
-    def organize_folder(self, directory_path: str) -> tuple[bool, str | list[str]]:
+    def scan_folder(self, directory_path: str) -> tuple[bool, str | Iterator[ScannedFile]]:
         """
-        Organize files in the specified directory.
-        
+        Validate a directory and start scanning its files.
+
+        In recursive mode the whole tree is walked, except for the file type folders
+        directly inside the directory, which are where the files are moved to. The
+        move journal is never returned as a file to be organized.
+
         Args:
             directory_path (str): Path of the directory to be organized
-        
+
         Returns:
-        Tuple[bool, str | List[str]]: A tuple containing:
+            tuple[bool, str | Iterator[ScannedFile]]: A tuple containing:
                 - A boolean indicating the success of the operation.
-                - A single error message or a list of error messages.
+                - An iterator over the files, or an error message if the directory is invalid.
         """
         path = Path(directory_path)
 
@@ -149,7 +869,11 @@ class FileOrganizer:
             return False, "O Caminho fornecido não é absoluto."
         
         try:
-            files = [file for file in path.iterdir() if file.is_file()]
+            with_stat = self.rule_engine.needs_stat
+            if self.recursive:
+                files = walk_files(path, self.max_depth, self.get_file_types(), with_stat)
+            else:
+                files = scan_files(path, with_stat)
         except FileNotFoundError:
             return False, "O Diretório fornecido não existe"
         except NotADirectoryError:
@@ -157,67 +881,730 @@ class FileOrganizer:
         except Exception as e:
             return False, f"Ocorreu um erro: {e}"
 
-        success = True
-        errors = []
-        for file in files:
-            file_extension = file.suffix
-            file_type = self.file_type_dict.get(file_extension.lower())
-            
-            if not file_type:
-                file_type = self.file_type_dict.get("others", "Others")
+        return True, (file for file in files if file.name != JOURNAL_FILE_NAME)
+
+    def plan_folder(self, directory_path: str) -> tuple[bool, str | MovePlan]:
+        """
+        Build the move plan for the specified directory without moving any file.
+
+        Only the directory scan touches the filesystem, so planning (and a dry run)
+        costs a single pass over the directory entries.
+
+        Args:
+            directory_path (str): Path of the directory to be organized
+
+        Returns:
+            tuple[bool, str | MovePlan]: A tuple containing:
+                - A boolean indicating the success of the operation.
+                - The move plan, or an error message if the directory is invalid.
+        """
+        success, files = self.scan_folder(directory_path)
+        if not success:
+            return False, files
+
+        path = Path(directory_path)
+        return True, next(self.iter_plans(path, files, batch_size=None), MovePlan(path))
+
+    def iter_plans(self, directory: Path, files: Iterable[ScannedFile], batch_size: int | None = PLAN_BATCH_SIZE) -> Iterator[MovePlan]:
+        """
+        Split a stream of files into move plans of at most batch_size files.
+
+        The cancel event is checked before each file, so a cancelled run stops scanning
+        and classifying at once; the partial plan is then dropped. The content detection
+        cache, if enabled, is saved when the stream ends.
+
+        Args:
+            directory (Path): The directory being organized.
+            files (Iterable[ScannedFile]): The files, usually returned by scan_folder.
+            batch_size (int | None, optional): Maximum number of files per plan, or None
+                for a single plan with every file. Defaults to PLAN_BATCH_SIZE.
+
+        Returns:
+            Iterator[MovePlan]: An iterator over the move plans.
+        """
+        stats = self.stats
+        cancel_event = self.cancel_event
+        files = iter(files) if stats is None else stats.timed_iter(SCAN, files)
+        try:
+            while True:
+                plan = MovePlan(directory)
+                if stats is None:
+                    for file in islice(files, batch_size):
+                        if cancel_event.is_set():
+                            return
+                        plan.add(self.get_file_type(file.name, file.path, file.stat), file)
+                else:
+                    for file in islice(files, batch_size):
+                        if cancel_event.is_set():
+                            return
+                        started = perf_counter()
+                        file_type = self.get_file_type(file.name, file.path, file.stat)
+                        stats.add(CLASSIFY, perf_counter() - started)
+                        plan.add(file_type, file)
+                    stats.count(FILES, len(plan))
+                if not plan.moves:
+                    return
+                yield plan
+        finally:
+            if self.content_detector is not None:
+                self.content_detector.save()
+
+    def execute_plan(self, plan: MovePlan, destination_indexes: dict[str, DestinationIndex] | None = None) -> tuple[bool, ErrorSummary]:
+        """
+        Execute a move plan, collecting the errors of iter_execute_plan.
+
+        Args:
+            plan (MovePlan): The plan produced by plan_folder or iter_plans.
+            destination_indexes (dict[str, DestinationIndex] | None, optional): Indexes
+                by file type, reused (and filled) across several plans of the same run.
+                Defaults to None.
+
+        Returns:
+            tuple[bool, ErrorSummary]: A tuple containing:
+                - A boolean indicating the success of the operation.
+                - The errors, with at most max_error_samples records.
+        """
+        return True, self.collect_errors(self.iter_execute_plan(plan, destination_indexes))
+
+    def collect_errors(self, events: Iterable[OrganizeEvent]) -> ErrorSummary:
+        """
+        Consume a stream of events, keeping only the errors.
+
+        Args:
+            events (Iterable[OrganizeEvent]): The events of a run.
+
+        Returns:
+            ErrorSummary: The errors, with at most max_error_samples records.
+        """
+        errors = ErrorSummary(self.max_error_samples)
+        for event in events:
+            if type(event) is ErrorEvent:
+                errors.add(event.record)
+        return errors
+
+    def iter_execute_plan(self, plan: MovePlan, destination_indexes: dict[str, DestinationIndex] | None = None) -> Iterator[MoveEvent | ErrorEvent]:
+        """
+        Execute a move plan, one destination folder at a time, yielding an event per file.
+
+        Each destination folder is created and indexed once, followed by all the
+        renames into it. Name collisions are resolved through a DestinationIndex.
+        When the organizer has more than one worker, folder creation and renames run
+        on a thread pool; names are still reserved on the calling thread, so files
+        with the same name never race for the same destination. Events are yielded in
+        plan order as the moves complete.
+
+        Args:
+            plan (MovePlan): The plan produced by plan_folder or iter_plans.
+            destination_indexes (dict[str, DestinationIndex] | None, optional): Indexes
+                by file type, reused (and filled) across several plans of the same run.
+                Defaults to None.
+
+        Returns:
+            Iterator[MoveEvent | ErrorEvent]: An iterator over the result of each move.
+        """
+        if destination_indexes is None:
+            destination_indexes = {}
+        if self.workers > 1:
+            yield from self._iter_execute_plan_concurrently(plan, destination_indexes)
+            return
+
+        cancel_event = self.cancel_event
+        for file_type, files in plan.moves.items():
+            destination_index = destination_indexes.get(file_type)
+            if destination_index is None:
+                destination_index = destination_indexes[file_type] = self._prepare_destination(plan.directory / file_type)
+
+            for file in files:
+                if cancel_event.is_set():
+                    return
+                new_name = self._reserve_name(destination_index, file.name)
+                event = self._move_file(file.path, new_name, destination_index, file_type)
+                self._file_processed()
+                yield event
+
+    def _iter_execute_plan_concurrently(self, plan: MovePlan, destination_indexes: dict[str, DestinationIndex]) -> Iterator[MoveEvent | ErrorEvent]:
+        # imported here so that sequential runs don't pay for concurrent.futures (and logging) at startup
+        from concurrent.futures import ThreadPoolExecutor
+
+        max_pending = self.workers * 4
 
-            destination_folder = path / file_type
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            new_types = [file_type for file_type in plan.moves if file_type not in destination_indexes]
+            new_folders = [plan.directory / file_type for file_type in new_types]
+            destination_indexes.update(zip(new_types, executor.map(self._prepare_destination, new_folders)))
+
+            pending = deque()
+            for file_type, files in plan.moves.items():
+                destination_index = destination_indexes[file_type]
+                for file in files:
+                    if self.cancel_event.is_set():
+                        break
+                    new_name = self._reserve_name(destination_index, file.name)
+                    pending.append(executor.submit(self._move_file, file.path, new_name, destination_index, file_type))
+
+                    if len(pending) >= max_pending:
+                        event = pending.popleft().result()
+                        self._file_processed()
+                        yield event
+
+            while pending:
+                event = pending.popleft().result()
+                self._file_processed()
+                yield event
+
+    def _file_processed(self) -> None:
+        self.processed_files += 1
+        if self.on_progress is not None:
+            self.on_progress(self.processed_files, self.planned_files)
+
+    def _prepare_destination(self, destination_folder: Path) -> DestinationIndex:
+        # up to workers * 4 queued moves, plus a retried reservation on each worker
+        in_flight = self.workers * 5
+        stats = self.stats
+        if stats is None:
             destination_folder.mkdir(exist_ok=True)
+            return DestinationIndex(destination_folder, in_flight)
+
+        started = perf_counter()
+        destination_folder.mkdir(exist_ok=True)
+        indexed = perf_counter()
+        destination_index = DestinationIndex(destination_folder, in_flight)
+        stats.add(MKDIR, indexed - started)
+        stats.add(INDEX, perf_counter() - indexed)
+        return destination_index
+
+    def _reserve_name(self, destination_index: DestinationIndex, file_name: str) -> str:
+        stats = self.stats
+        if stats is None:
+            return destination_index.reserve(file_name)
 
-            new_path = destination_folder / file.name
+        started = perf_counter()
+        new_name = destination_index.reserve(file_name)
+        stats.add(RESERVE, perf_counter() - started)
+        if new_name != file_name:
+            stats.count(COLLISIONS)
+        return new_name
+
+    def _move_file(self, file_path: str, new_name: str, destination_index: DestinationIndex, file_type: str) -> MoveEvent | ErrorEvent:
+        stats = self.stats
+        if stats is not None:
+            started = perf_counter()
 
+        file = Path(file_path)
+        new_path = destination_index.folder / new_name
+        try:
             try:
-                file.rename(new_path)
+                self.file_mover.move(file, new_path)
             except FileExistsError:
-                unique_name = self.get_unique_file_name(destination_folder, file)
-                new_path = destination_folder / unique_name
-                file.rename(new_path)
-            except PermissionError:
-                errors.append(f"Sem permissão para mover o arquivo {file}")
-            except Exception as e:
-                errors.append(f"Ocorreu um erro ao tentar mover o arquivo {file}: {e}")
+                if stats is not None:
+                    stats.count(RETRIES)
+                new_path = destination_index.folder / self._reserve_name(destination_index, file.name)
+                self.file_mover.move(file, new_path)
+        except Exception as e:
+            if stats is not None:
+                stats.count(ERRORS)
+            return ErrorEvent(file_path, ErrorRecord.from_exception(MOVE, file_path, e))
+
+        if stats is not None:
+            moved = perf_counter()
+            stats.add(RENAME, moved - started)
+            stats.count(MOVED)
+
+        destination = str(new_path)
+        if self.journal is not None:
+            self.journal.record(file_path, destination)
+            if stats is not None:
+                stats.add(JOURNAL, perf_counter() - moved)
+        return MoveEvent(file_path, destination, file_type)
+
+    def organize_folder(self, directory_path: str) -> tuple[bool, str | ErrorSummary]:
+        """
+        Organize files in the specified directory.
+
+        Every move is recorded in a MoveJournal inside the directory, so the run can be
+        undone with undo_folder. If a previous run was interrupted, its journal is
+        continued; the files it moved are no longer in the directory, so only the
+        remaining ones are organized. The directory (or the tree, in recursive mode) is
+        streamed through iter_plans, so only one batch of files is held in memory at a time.
         
-        return success, errors
+        Args:
+            directory_path (str): Path of the directory to be organized
+        
+        Returns:
+        Tuple[bool, str | ErrorSummary]: A tuple containing:
+                - A boolean indicating the success of the operation.
+                - A single error message, or the errors of the run.
+        """
+        success, events = self.iter_organize(directory_path)
+        if not success:
+            return False, events
+        return True, self.collect_errors(events)
+
+    def iter_organize(self, directory_path: str) -> tuple[bool, str | Iterator[OrganizeEvent]]:
+        """
+        Validate a directory and start organizing it, streaming an event per file.
+
+        Works like organize_folder, but nothing is moved until the iterator is
+        consumed, and the result of each file is yielded as soon as it is known: a
+        MoveEvent or an ErrorEvent. Files are scanned and classified PLAN_BATCH_SIZE at
+        a time, so the first events arrive after the first batch and not after the whole
+        directory. There is no event for the files moved by an interrupted run: they are
+        no longer in the directory, so they are simply not scanned again. Stopping the
+        iteration early leaves the run interrupted, so the next run resumes it.
+
+        Args:
+            directory_path (str): Path of the directory to be organized
+
+        Returns:
+            tuple[bool, str | Iterator[OrganizeEvent]]: A tuple containing:
+                - A boolean indicating the success of the operation.
+                - An iterator over the events, or an error message if the directory is invalid.
+        """
+        success, files = self.scan_folder(directory_path)
+        if not success:
+            return False, files
+
+        return True, self._iter_organize(Path(directory_path), files, {}, PLAN_BATCH_SIZE)
+
+    def organize_files(self, directory_path: str, file_names: Iterable[str], destination_indexes: dict[str, DestinationIndex] | None = None, journal: MoveJournal | None = None) -> tuple[bool, str | ErrorSummary]:
+        """
+        Organize only the given files of the specified directory.
+
+        Used by watch mode to move new arrivals without rescanning the directory. Names
+        that no longer exist or are not regular files are ignored.
+
+        Args:
+            directory_path (str): Path of the directory to be organized
+            file_names (Iterable[str]): Names of the files, directly inside the directory.
+            destination_indexes (dict[str, DestinationIndex] | None, optional): Indexes
+                kept by the caller across calls. Defaults to None.
+            journal (MoveJournal | None, optional): An open journal kept by the caller
+                across calls, which is neither resumed nor closed here. Defaults to None.
+
+        Returns:
+            tuple[bool, str | ErrorSummary]: A tuple containing:
+                - A boolean indicating the success of the operation.
+                - A single error message, or the errors of the run.
+        """
+        path = Path(directory_path)
+
+        if not path.is_absolute():
+            return False, "O Caminho fornecido não é absoluto."
+        if not path.is_dir():
+            return False, "O Caminho especificado não leva a um diretório"
+
+        files = []
+        for file_name in file_names:
+            file_path = os.path.join(path, file_name)
+            if file_name != JOURNAL_FILE_NAME and os.path.isfile(file_path):
+                files.append(ScannedFile(file_name, file_path))
+
+        if destination_indexes is None:
+            destination_indexes = {}
+        if journal is None:
+            return True, self.collect_errors(self._iter_organize(path, files, destination_indexes, None))
+
+        self.journal = journal
+        try:
+            return self.execute_plan(next(self.iter_plans(path, files, None), MovePlan(path)), destination_indexes)
+        finally:
+            self.journal = None
+
+    def _iter_organize(self, path: Path, files: Iterable[ScannedFile], destination_indexes: dict[str, DestinationIndex], batch_size: int | None) -> Iterator[OrganizeEvent]:
+        journal = MoveJournal(path)
+        journal.open()
+
+        finished = False
+        started = perf_counter()
+        self.journal = journal
+        self.processed_files = 0
+        self.planned_files = 0
+        try:
+            for plan in self.iter_plans(path, files, batch_size):
+                self.planned_files += len(plan)
+                yield from self.iter_execute_plan(plan, destination_indexes)
+                if self.cancel_event.is_set():
+                    break
+            finished = not self.cancel_event.is_set()
+        finally:
+            self.journal = None
+            journal.close(finished)
+            if self.stats is not None:
+                self.stats.add(TOTAL, perf_counter() - started)
+
+    def cancel(self) -> None:
+        """
+        Ask the run in progress (and any later run of this organizer) to stop. Can be
+        called from another thread.
+
+        The run stops before its next file; the files already moved stay recorded in
+        the journal, so the next run continues from there (or undo_folder reverts them).
+        """
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether the last run was stopped by cancel before organizing every file.
+        """
+        return self.cancel_event.is_set()
+
+    def undo_folder(self, directory_path: str) -> tuple[bool, str | ErrorSummary]:
+        """
+        Undo the last organization of the specified directory, using its move journal.
+
+        Args:
+            directory_path (str): Path of the organized directory
+        
+        Returns:
+            tuple[bool, str | ErrorSummary]: A tuple containing:
+                - A boolean indicating the success of the operation.
+                - A single error message, or the errors of the restoration.
+        """
+        path = Path(directory_path)
+
+        if not path.is_absolute():
+            return False, "O Caminho fornecido não é absoluto."
+        if not path.is_dir():
+            return False, "O Caminho especificado não leva a um diretório"
+
+        return MoveJournal(path).undo(self.file_mover, self.max_error_samples)
+
+def positive_int(value: str) -> int:
+    """
+    Convert a command line argument to a positive integer.
+
+    Args:
+        value (str): The argument value.
+
+    Returns:
+        int: The converted value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a positive integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"valor inválido: {value} (use um inteiro positivo)")
+    return number
+
+def non_negative_int(value: str) -> int:
+    """
+    Convert a command line argument to a non-negative integer.
+
+    Args:
+        value (str): The argument value.
+
+    Returns:
+        int: The converted value.
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not a non-negative integer.
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"valor inválido: {value} (use um inteiro não negativo)")
+    return number
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    """
+    Parse the command line arguments.
+
+    Args:
+        args (list[str]): The arguments, without the program name.
+
+    Returns:
+        argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(description="Organiza os arquivos de uma pasta em subpastas de acordo com seus tipos.")
+    parser.add_argument("directories", nargs="*", metavar="directory", help="caminho absoluto do diretório a ser organizado (vários diretórios são processados em lote)")
+    parser.add_argument("--from-file", metavar="ARQUIVO", help="lê os diretórios de um arquivo, um por linha")
+    parser.add_argument("--processes", type=positive_int, metavar="N", help="número de processos usados no modo em lote (padrão: número de CPUs)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--dry-run", action="store_true", help="mostra o que seria movido, sem mover nenhum arquivo")
+    mode.add_argument("--undo", action="store_true", help="desfaz a última organização do diretório")
+    mode.add_argument("--watch", action="store_true", help="continua observando o diretório e organiza os novos arquivos conforme chegam")
+    parser.add_argument("--workers", type=positive_int, default=DEFAULT_WORKERS, metavar="N", help=f"número de threads usadas para mover os arquivos (padrão: {DEFAULT_WORKERS})")
+    parser.add_argument("--sniff", action="store_true", help="identifica pelo conteúdo os arquivos com extensão desconhecida")
+    parser.add_argument("--recursive", action="store_true", help="organiza também os arquivos das subpastas")
+    parser.add_argument("--max-depth", type=non_negative_int, metavar="N", help="profundidade máxima de subpastas no modo recursivo (implica --recursive)")
+    parser.add_argument("--max-errors", type=positive_int, default=MAX_ERROR_SAMPLES, metavar="N", help=f"número máximo de erros detalhados; os demais são apenas contados por tipo (padrão: {MAX_ERROR_SAMPLES})")
+    parser.add_argument("--stats", action="store_true", help="mostra o tempo gasto em cada fase da organização")
+    parser.add_argument("--profile", metavar="ARQUIVO", help="salva um perfil do cProfile (formato pstats) no arquivo")
+    parsed = parser.parse_args(args)
+
+    if parsed.from_file:
+        from batch_organizer import read_directory_list
+        try:
+            parsed.directories += read_directory_list(parsed.from_file)
+        except OSError as e:
+            parser.error(f"não foi possível ler a lista de diretórios: {e}")
+        if not parsed.directories:
+            parser.error("a lista de diretórios está vazia")
+    if len(parsed.directories) > 1 and (parsed.dry_run or parsed.watch or parsed.stats or parsed.profile):
+        parser.error("--dry-run, --watch, --stats e --profile aceitam apenas um diretório")
+    return parsed
+
+def print_plan(summary: dict[str, int]) -> None:
+    """
+    Print the summary of a move plan.
+
+    Args:
+        summary (dict[str, int]): Number of files planned for each file type.
+    """
+    if not summary:
+        print("\nNenhum arquivo para organizar.")
+        return
+    print("\nPrévia da organização (nenhum arquivo foi movido):")
+    for file_type, count in summary.items():
+        print(f"- {file_type}: {count} arquivo(s)")
+    print(f"Total: {sum(summary.values())} arquivo(s)")
+
+def print_errors(errors: ErrorSummary) -> None:
+    """
+    Print the detailed errors and, when some were only counted, the count of each kind.
+
+    Args:
+        errors (ErrorSummary): The errors of the run.
+    """
+    for record in errors:
+        print(f"- {record.format()}")
+    if errors.omitted:
+        print(f"... e mais {errors.omitted} erro(s). Total por tipo:")
+        for line in errors.format_counts():
+            print(f"  {line}")
+
+def print_result(success: bool, errors: str | ErrorSummary, action: str = "Organização") -> None:
+    """
+    Print the result of an organization (or of its undo).
+
+    Args:
+        success (bool): Whether the operation could be completed.
+        errors (str | ErrorSummary): A single error message, or the errors of the run.
+        action (str, optional): Name of the operation. Defaults to "Organização".
+    """
+    if success:
+        if errors:
+            print(f"\n{action} concluída com {len(errors)} erro(s).\nErros encontrados:")
+            print_errors(errors)
+        else:
+            print(f"\n{action} concluída com sucesso!")
+
+    else:
+        print(f"\nA {action.lower()} não pôde ser concluída.\nErro ocorrido:")
+        print(f"- {errors}")
+
+def log_result(error_log: ErrorLog, success: bool, errors: str | ErrorSummary, action: str = "Organização") -> None:
+    """
+    Record the errors of an organization (or of its undo) in the persistent error log.
+
+    Args:
+        error_log (ErrorLog): The error log.
+        success (bool): Whether the operation could be completed.
+        errors (str | ErrorSummary): A single error message, or the errors of the run.
+        action (str, optional): Name of the operation. Defaults to "Organização".
+    """
+    if success:
+        error_log.add_errors(errors, "Erro ao restaurar arquivo" if action == "Restauração" else "Erro ao mover arquivo")
+    else:
+        error_log.add_log("Critical Error", f"Falha na {action.lower()}", errors)
+
+def organize(organizer: FileOrganizer, directory: str, error_log: ErrorLog | None = None) -> bool:
+    """
+    Organize the directory, consuming the events of iter_organize, and print the result.
+
+    Moves are just counted, and at most max_error_samples errors are kept
+    until the end.
+
+    Args:
+        organizer (FileOrganizer): The organizer used to move the files.
+        directory (str): Path of the directory to be organized.
+        error_log (ErrorLog | None, optional): Where the errors are also recorded.
+            Defaults to None.
+
+    Returns:
+        bool: Whether the organization could be completed.
+    """
+    success, events = organizer.iter_organize(directory)
+    if not success:
+        print_result(False, events)
+        if error_log is not None:
+            log_result(error_log, False, events)
+        return False
+
+    moved = 0
+    errors = ErrorSummary(organizer.max_error_samples)
+    for event in events:
+        if type(event) is MoveEvent:
+            moved += 1
+        else:
+            errors.add(event.record)
+
+    print(f"\n{moved} arquivo(s) movido(s).")
+    print_result(True, errors)
+    if error_log is not None:
+        log_result(error_log, True, errors)
+    return True
+
+def watch(organizer: FileOrganizer, directory: str, error_log: ErrorLog | None = None) -> None:
+    """
+    Organize the directory and keep organizing new files until interrupted.
+
+    Args:
+        organizer (FileOrganizer): The organizer used to move the files.
+        directory (str): Path of the directory to be watched.
+        error_log (ErrorLog | None, optional): Where the errors are also recorded; it is
+            flushed after each cycle with errors. Defaults to None.
+    """
+    from folder_watcher import FolderWatcher
+
+    if not organize(organizer, directory, error_log):
+        return
+
+    def on_organized(file_names: list[str], errors: ErrorSummary) -> None:
+        print(f"{len(file_names) - len(errors)} arquivo(s) organizado(s).")
+        print_errors(errors)
+        if error_log is not None and errors:
+            log_result(error_log, True, errors)
+            error_log.flush()
+
+    print("\nObservando a pasta. Pressione Ctrl+C para sair.")
+    FolderWatcher(organizer, directory).run(on_organized)
+
+def dry_run(organizer: FileOrganizer, directory: str) -> tuple[bool, str | None]:
+    """
+    Print what would be moved, streaming the plan so memory stays bounded.
+
+    Args:
+        organizer (FileOrganizer): The organizer used to classify the files.
+        directory (str): Path of the directory to be organized.
+
+    Returns:
+        tuple[bool, str | None]: A tuple containing:
+            - A boolean indicating the success of the operation.
+            - An error message if the directory is invalid, None otherwise.
+    """
+    success, files = organizer.scan_folder(directory)
+    if not success:
+        return False, files
+
+    summary = {}
+    started = perf_counter()
+    for plan in organizer.iter_plans(Path(directory), files):
+        for file_type, count in plan.summary().items():
+            summary[file_type] = summary.get(file_type, 0) + count
+    if organizer.stats is not None:
+        organizer.stats.add(TOTAL, perf_counter() - started)
+    print_plan(summary)
+    return True, None
+
+def batch(args: argparse.Namespace) -> None:
+    """
+    Organize (or restore) several directories on a pool of processes.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+    """
+    from batch_organizer import run_batch
+
+    error_log = ErrorLog()
+    _, _, csv_error = load_mapping()
+    if csv_error:
+        print(csv_error)
+        error_log.add_log("CSV Error", "Erro ao carregar arquivo CSV", csv_error)
+    _, rules_error = RuleEngine.from_csv()
+    if rules_error:
+        print(rules_error)
+        error_log.add_log("Rules Error", "Erro ao carregar as regras", rules_error)
+
+    options = {
+        "workers": args.workers,
+        "recursive": args.recursive or args.max_depth is not None,
+        "max_depth": args.max_depth,
+        "sniff_content": args.sniff,
+        "max_error_samples": args.max_errors,
+    }
+    try:
+        run_batch(args.directories, options, args.processes, args.undo, error_log)
+    except KeyboardInterrupt:
+        print("\nOperação cancelada pelo usuário.")
+    finally:
+        error_log.flush()
 
 def main():
     """Main function for execution via command line"""
-    organizer = FileOrganizer()
+    args = parse_args(argv[1:])
+    if len(args.directories) > 1:
+        batch(args)
+        return
+
+    organizer = FileOrganizer(
+        workers=args.workers,
+        recursive=args.recursive or args.max_depth is not None,
+        max_depth=args.max_depth,
+        sniff_content=args.sniff,
+        collect_stats=args.stats,
+        max_error_samples=args.max_errors
+    )
     
+    error_log = ErrorLog()
     if organizer.csv_error:
         print(organizer.csv_error)
-    if len(argv) > 1:
-        directory = argv[1]
+        error_log.add_log("CSV Error", "Erro ao carregar arquivo CSV", organizer.csv_error)
+    if organizer.rules_error:
+        print(organizer.rules_error)
+        error_log.add_log("Rules Error", "Erro ao carregar as regras", organizer.rules_error)
+    if args.directories:
+        directory = args.directories[0]
     else:
         try:
             directory = input("Digite o caminho do diretório: ")
         except KeyboardInterrupt:
             print("\nOperação cancelada pelo usuário.")
+            error_log.flush()
             exit(0)
-    try:
-        success, errors = organizer.organize_folder(directory)
-        
-        if success:
-            if errors:
-                print("\nOrganização concluída com alguns erros.\nErros encontrados:")
-                for error in errors:
-                    print(f"- {error}")
-            else:
-                print("\nOrganização concluída com sucesso!")
 
+    profiler = None
+    if args.profile:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        if args.dry_run:
+            success, errors = dry_run(organizer, directory)
+            if not success:
+                print_result(success, errors)
+        elif args.undo:
+            success, errors = organizer.undo_folder(directory)
+            print_result(success, errors, "Restauração")
+            log_result(error_log, success, errors, "Restauração")
+        elif args.watch:
+            watch(organizer, directory, error_log)
         else:
-            print("\nA organização não pôde ser concluída.\nErro ocorrido:")
-            print(f"- {errors}")
+            organize(organizer, directory, error_log)
         
     except KeyboardInterrupt:
         print("\nOperação cancelada pelo usuário.")
+        if not (args.dry_run or args.undo or args.watch):
+            print("Os arquivos já movidos foram registrados: execute novamente para continuar ou use --undo para desfazer.")
         return
     except Exception as e:
         print(f"\nOcorreu um erro inesperado: {e}")
+        error_log.add_log("Unexpected Error", "Erro inesperado", str(e))
+    finally:
+        error_log.flush()
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+            print(f"\nPerfil salvo em {args.profile} (use python -m pstats para analisá-lo).")
+        if organizer.stats is not None and organizer.stats.seconds:
+            print(f"\n{organizer.stats.format_table()}")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -1,10 +1,16 @@
 import customtkinter as ctk
-from tkinter import filedialog
+from tkinter import filedialog, messagebox
 from PIL import Image
 from pathlib import Path
-from folder_organizer import FileOrganizer
+from functools import lru_cache
+from typing import Callable
+import queue
+import threading
+import time
+from folder_organizer import FileOrganizer, MAPPING_CACHE
+from error_records import ErrorSummary
+from error_log import ErrorLog
 from error_log_window import *
-from app_config import SettingsFrame
 try:
     from ctypes import windll, byref, sizeof, c_int
 except:
@@ -19,6 +25,9 @@ TITLE_HEX_COLOR = 0x00312822
 APP_WIDTH = 500
 APP_HEIGHT = 500
 
+PROGRESS_POLL_INTERVAL = 100
+SAVE_ERROR_POLL_INTERVAL = 500
+
 ROOT_IMAGE_PATH = Path(__file__).parent.parent / "images"
 ICO_IMAGE = ROOT_IMAGE_PATH / "empty.ico"
 WELCOME_IMAGE = ROOT_IMAGE_PATH / "welcome.png"
@@ -30,6 +39,26 @@ RETURN_ICON = ROOT_IMAGE_PATH / "return_icon.png"
 RETURN_ICON_HOVER = ROOT_IMAGE_PATH / "return_icon_hover.png"
 
 
+@lru_cache(maxsize=None)
+def load_image(path: Path, size: tuple[int, int]) -> ctk.CTkImage:
+    """
+    Loads an image once and shares it between all the widgets that use it.
+
+    The file is decoded on the first request only, and the same decoded image is
+    used for both the light and the dark appearance.
+
+    Args:
+        path (Path): Path of the image file.
+        size (tuple[int, int]): Display size of the image.
+
+    Returns:
+        ctk.CTkImage: The shared image.
+    """
+    image = Image.open(path)
+    image.load()
+    return ctk.CTkImage(light_image=image, dark_image=image, size=size)
+
+
 class App(ctk.CTk):
     """
     Main application class for the folder organizer GUI.
@@ -45,12 +74,18 @@ class App(ctk.CTk):
         path_frame (PathFrame): Frame containing path entry.
         error_log (ErrorLog): Instance of ErrorLog to manage error logging.
         buttons_frame (ButtonsFrame): Frame containing the main buttons.
-        return_button (ctk.CTkLabel): Icon to return to the main interface.
-        settings_frame (SettingsFrame): Frame containing the settings interface.
+        return_icon (ctk.CTkLabel | None): Icon to return to the main interface, built on first use.
+        settings_frame (SettingsFrame | None): Frame containing the settings interface, built on first use.
+        save_errors (queue.SimpleQueue): Errors of the mapping writes done behind, reported by the timer thread.
+        closing (bool): Whether the window is waiting for the organization to stop before closing.
 
     Methods:
+        on_close: Stops the organization in progress, then closes the window.
+        close_window: Flushes the error log and mappings and destroys the window.
+        poll_save_errors: Shows the errors of the mapping writes done behind.
         change_title_bar_color: Changes the title bar color for Windows 11.
         place_main_interface: Places the main interface and removes the settings interface components.
+        build_settings_interface: Builds the settings interface on first use.
         place_settings_interface: Places the settings interface and removes the main interface components.
     """
     def __init__(self):
@@ -72,11 +107,7 @@ class App(ctk.CTk):
         self.entry_font = ctk.CTkFont(family="Dubai", size=14)
         self.buttons_font = "Tahoma"
 
-        welcome_image = ctk.CTkImage(
-            light_image=Image.open(WELCOME_IMAGE),
-            dark_image=Image.open(WELCOME_IMAGE),
-            size=(400, 220)
-        )
+        welcome_image = load_image(WELCOME_IMAGE, (400, 220))
 
         self.welcome_label = ctk.CTkLabel(master=self, text="", image=welcome_image)
         self.welcome_label.place(y=25, relx=0.5, anchor="n")
@@ -93,31 +124,61 @@ class App(ctk.CTk):
 
         CornerButtons(self, self.error_log)
 
-        self.return_image = ctk.CTkImage(
-            light_image=Image.open(RETURN_ICON),
-            dark_image=Image.open(RETURN_ICON),
-            size=(16, 16)
-        )
-        
-        self.hover_return_image = ctk.CTkImage(
-            light_image=Image.open(RETURN_ICON_HOVER),
-            dark_image=Image.open(RETURN_ICON_HOVER),
-            size=(16, 16)
-        )
+        self.save_errors = queue.SimpleQueue()
+        MAPPING_CACHE.on_save_error = self.save_errors.put
+        self.after(SAVE_ERROR_POLL_INTERVAL, self.poll_save_errors)
 
-        self.return_icon = ctk.CTkLabel(
-            master=self,
-            text="",
-            image=self.return_image,
-            cursor="hand2"
-        )
-        
-        self.return_icon.bind("<Button-1>", lambda e: self.place_main_interface())
-        self.return_icon.bind("<Enter>", lambda e: self.return_icon.configure(image=self.hover_return_image))
-        self.return_icon.bind("<Leave>", lambda e: self.return_icon.configure(image=self.return_image))
+        self.closing = False
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        self.return_icon = None
+        self.settings_frame = None
 
         self.mainloop()
     
+    def on_close(self) -> None:
+        """
+        Stops the organization in progress, if any, then closes the window with
+        close_window. The window keeps responding while the organization stops.
+        """
+        if self.closing:
+            return
+        self.closing = True
+        self.buttons_frame.stop_organization(self.close_window)
+
+    def close_window(self) -> None:
+        """
+        Writes the pending mapping edits and the buffered error logs and destroys the
+        window. If the mappings couldn't be saved, the error is logged and shown first.
+        """
+        MAPPING_CACHE.on_save_error = None
+        save_error = MAPPING_CACHE.flush()
+        if save_error:
+            self.error_log.add_log("CSV Error", "Erro ao salvar arquivo CSV", save_error)
+        self.error_log.flush()
+        if save_error:
+            messagebox.showerror("Erro ao salvar arquivo CSV", save_error)
+        self.destroy()
+
+    def poll_save_errors(self) -> None:
+        """
+        Logs and notifies the errors of the mapping writes done behind, received from
+        the timer thread, and schedules the next poll.
+        """
+        while True:
+            try:
+                save_error = self.save_errors.get_nowait()
+            except queue.Empty:
+                break
+            short_message = "Erro ao salvar arquivo CSV"
+            self.error_log.add_log("CSV Error", short_message, save_error)
+            self.buttons_frame.notification_manager.show_notification(
+                short_message,
+                message_type="error",
+                duration=5000
+            )
+        self.after(SAVE_ERROR_POLL_INTERVAL, self.poll_save_errors)
+
     def change_title_bar_color(self) -> None:
         """
         Changes the title bar color for Windows 11.
@@ -142,17 +203,44 @@ class App(ctk.CTk):
         self.welcome_label.place(y=25, relx=0.5, anchor="n")
         self.return_icon.place_forget()
         self.settings_frame.place_forget()
-        del self.settings_frame
+
+    def build_settings_interface(self) -> None:
+        """
+        Builds the Settings Frame and the return icon.
+        The settings module is only imported here, so startup doesn't pay for it.
+        """
+        from app_config import SettingsFrame
+
+        self.return_image = load_image(RETURN_ICON, (16, 16))
+        self.hover_return_image = load_image(RETURN_ICON_HOVER, (16, 16))
+
+        self.return_icon = ctk.CTkLabel(
+            master=self,
+            text="",
+            image=self.return_image,
+            cursor="hand2"
+        )
+        
+        self.return_icon.bind("<Button-1>", lambda e: self.place_main_interface())
+        self.return_icon.bind("<Enter>", lambda e: self.return_icon.configure(image=self.hover_return_image))
+        self.return_icon.bind("<Leave>", lambda e: self.return_icon.configure(image=self.return_image))
+
+        self.settings_frame = SettingsFrame(self)
 
     def place_settings_interface(self) -> None:
         """
         Places the Settings Frame (Interface) and removes all Main Interface components.
+        The Settings Frame is built on first use and kept for the next visits.
         """
+        if self.settings_frame is None:
+            self.build_settings_interface()
+        else:
+            self.settings_frame.reload_data()
+
         self.path_frame.place_forget()
         self.buttons_frame.place_forget()
         self.welcome_label.place_forget()
         self.return_icon.place(relx=0.02, rely=0.01, anchor="nw")
-        self.settings_frame = SettingsFrame(self)
         self.settings_frame.place(relx=0.5, y=40, relwidth=0.99, relheight=0.91, anchor="n")
 
 
@@ -208,17 +296,9 @@ class PathFrame(ctk.CTkFrame):
         )
         self.path_entry.place(relx=0.02, rely=0.5, anchor="w")
 
-        self.normal_image = ctk.CTkImage(
-            light_image=Image.open(FOLDER_ICON),
-            dark_image=Image.open(FOLDER_ICON),
-            size=(16, 16)
-        )
+        self.normal_image = load_image(FOLDER_ICON, (16, 16))
         
-        self.hover_image = ctk.CTkImage(
-            light_image=Image.open(FOLDER_ICON_HOVER),
-            dark_image=Image.open(FOLDER_ICON_HOVER),
-            size=(16, 16)
-        )
+        self.hover_image = load_image(FOLDER_ICON_HOVER, (16, 16))
 
         self.folder_icon = ctk.CTkLabel(
             master=self,
@@ -277,10 +357,24 @@ class ButtonsFrame(ctk.CTkFrame):
         error_log (ErrorLog): Instance to manage error logging.
         organize_button (ctk.CTkButton): Button to trigger folder organization.
         config_button (ctk.CTkButton): Button to access application settings.
+        preview_button (ctk.CTkButton): Button to preview the organization without moving files.
         buttons (tuple): Tuple containing all buttons in this frame.
+        progress_frame (ProgressFrame): Frame shown in place of the buttons while organizing.
+        organizer (FileOrganizer | None): The organizer of the run in progress, if any.
+        worker (threading.Thread | None): The background thread of the last run.
+        progress_queue (queue.SimpleQueue): Messages from the background thread to the main loop.
 
     Methods:
-        organize_folder: Handles the folder organization process and error management.
+        organize_folder: Starts the folder organization on a background thread.
+        run_organizer: Runs the organization on the background thread.
+        report_progress: Queues the progress of the organization.
+        poll_progress: Drains the progress queue on the main loop.
+        cancel_organization: Asks the organization in progress to stop.
+        stop_organization: Cancels the organization in progress and calls back once it stopped.
+        finish_organization: Restores the buttons and reports the result of the organization.
+        preview_folder: Starts the preview of the organization on a background thread.
+        run_preview: Counts the files planned for each destination on the background thread.
+        finish_preview: Restores the buttons and shows the preview.
         app_config: 
         on_hover: Changes button appearance on mouse hover.
         on_leave: Reverts button appearance when mouse leaves.
@@ -304,6 +398,11 @@ class ButtonsFrame(ctk.CTkFrame):
         self.folder_path = folder_path
         self.notification_manager = NotificationManager(self.master)
         self.error_log = error_log
+        self.organizer = None
+        self.worker = None
+        self.progress_queue = queue.SimpleQueue()
+        self.last_progress_time = 0.0
+        self.progress_frame = ProgressFrame(parent, font)
 
         self.organize_button = ctk.CTkButton(
             master=self,
@@ -333,7 +432,21 @@ class ButtonsFrame(ctk.CTkFrame):
         )
         self.config_button.pack(expand=True)
 
-        self.buttons = (self.organize_button, self.config_button)
+        self.preview_button = ctk.CTkButton(
+            master=self,
+            text="Pré-visualizar",
+            font=(font, 14, "bold"),
+            text_color=TEXT_COLOR,
+            width=140,
+            height=32,
+            fg_color=SECONDARY_COLOR,
+            hover_color=CONTRAST_COLOR,
+            corner_radius=10,
+            command=self.preview_folder
+        )
+        self.preview_button.pack(expand=True)
+
+        self.buttons = (self.organize_button, self.config_button, self.preview_button)
 
         for button in self.buttons:
             button.bind("<Enter>", lambda e, btn=button: self.on_hover(btn))
@@ -345,83 +458,300 @@ class ButtonsFrame(ctk.CTkFrame):
 
         This method is called when the organize button is clicked. It creates a
         FileOrganizer instance, checks for CSV errors, validates the selected
-        directory, and manages the folder organization process. It also handles
-        error logging and notifications for various scenarios.
+        directory, and starts the organization on a background thread, so the
+        window keeps responding. Progress is received through a queue, drained by
+        poll_progress on the Tk main loop.
         """
-        organizer = FileOrganizer()
+        organizer = FileOrganizer(collect_stats=True)
+
+        if organizer.csv_error:
+            short_message = "Erro ao carregar arquivo CSV"
+            self.error_log.add_log(
+                "CSV Error",
+                short_message,
+                organizer.csv_error
+            )
+            self.notification_manager.show_notification(
+                short_message,
+                message_type="warning",
+                duration=5000
+            )
+
+        if organizer.rules_error:
+            short_message = "Erro ao carregar as regras"
+            self.error_log.add_log(
+                "Rules Error",
+                short_message,
+                organizer.rules_error
+            )
+            self.notification_manager.show_notification(
+                short_message,
+                message_type="warning",
+                duration=5000
+            )
 
+        directory = self.folder_path.get()
+        if not directory:
+            self.notification_manager.show_notification(
+                "Selecione uma pasta para organizar!",
+                message_type="error"
+            )
+            return
+
+        self.organizer = organizer
+        self.progress_queue = queue.SimpleQueue()
+        self.last_progress_time = 0.0
+        organizer.on_progress = self.report_progress
+
+        self.place_forget()
+        self.progress_frame.start(self.cancel_organization)
+        self.progress_frame.place(relx=0.5, rely=0.62, relwidth=0.8, anchor="n")
+
+        self.worker = threading.Thread(target=self.run_organizer, args=(organizer, directory), daemon=True)
+        self.worker.start()
+        self.after(PROGRESS_POLL_INTERVAL, self.poll_progress)
+
+    def run_organizer(self, organizer: FileOrganizer, directory: str) -> None:
+        """
+        Runs the organization. Called on the background thread, so it never touches
+        the widgets: the result is put on the progress queue.
+
+        Args:
+            organizer (FileOrganizer): The organizer used to move the files.
+            directory (str): The directory to be organized.
+        """
         try:
-            if organizer.csv_error:
-                short_message = "Erro ao carregar arquivo CSV"
-                self.error_log.add_log(
-                    "CSV Error",
-                    short_message,
-                    organizer.csv_error
-                )
+            success, errors = organizer.organize_folder(directory)
+            self.progress_queue.put(("done", success, errors))
+        except Exception as e:
+            self.progress_queue.put(("exception", False, str(e)))
+
+    def report_progress(self, processed: int, planned: int) -> None:
+        """
+        Queues the progress of the organization. Called on the background thread
+        after each file; updates are coalesced to one every PROGRESS_POLL_INTERVAL.
+
+        Args:
+            processed (int): Number of files processed so far.
+            planned (int): Number of files planned so far.
+        """
+        now = time.monotonic()
+        if now - self.last_progress_time >= PROGRESS_POLL_INTERVAL / 1000 or processed == planned:
+            self.last_progress_time = now
+            self.progress_queue.put(("progress", processed, planned))
+
+    def poll_progress(self) -> None:
+        """
+        Drains the progress queue on the Tk main loop. Only the latest progress
+        update is shown, however many were queued since the last poll.
+        """
+        progress = None
+        result = None
+        while True:
+            try:
+                message = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == "progress":
+                progress = message[1:]
+            else:
+                result = message
+
+        if progress is not None:
+            self.progress_frame.update_progress(*progress)
+
+        if result is None:
+            self.after(PROGRESS_POLL_INTERVAL, self.poll_progress)
+        elif result[0] == "preview":
+            self.finish_preview(*result[1:])
+        else:
+            self.finish_organization(*result)
+
+    def cancel_organization(self) -> None:
+        """
+        Asks the organization in progress to stop before its next file.
+        """
+        self.organizer.cancel()
+        self.progress_frame.show_cancelling()
+
+    def stop_organization(self, on_stopped: Callable[[], None]) -> None:
+        """
+        Cancels the organization in progress, if any, and calls on_stopped once the
+        background thread has finished, so the journal is closed cleanly. The thread is
+        polled on the Tk main loop instead of joined, so the window never freezes.
+        Used when the window is closed.
+
+        Args:
+            on_stopped (Callable[[], None]): Called on the main loop once nothing is running.
+        """
+        if self.organizer is not None and not self.organizer.cancelled:
+            self.organizer.cancel()
+            self.progress_frame.show_cancelling()
+        if self.worker is not None and self.worker.is_alive():
+            self.after(PROGRESS_POLL_INTERVAL, self.stop_organization, on_stopped)
+            return
+        on_stopped()
+
+    def finish_organization(self, kind: str, success: bool, errors: str | ErrorSummary) -> None:
+        """
+        Restores the buttons and reports the result of the organization.
+
+        Args:
+            kind (str): "done" when the organization returned, "exception" when it raised.
+            success (bool): Whether the organization could be completed.
+            errors (str | ErrorSummary): A single error message, or the errors of the run.
+        """
+        organizer = self.organizer
+        self.organizer = None
+        self.progress_frame.place_forget()
+        self.place(relx=0.5, rely=0.59, relheight=0.36, anchor="n")
+
+        if kind == "exception":
+            short_message = "Erro inesperado"
+            self.error_log.add_log(
+                "Unexpected Error",
+                short_message,
+                errors
+            )
+            self.notification_manager.show_notification(
+                f"{short_message}. Verifique os logs.",
+                message_type="error",
+                duration=5000
+            )
+            return
+
+        if success:
+            self.error_log.add_errors(errors)
+            self.error_log.flush()
+
+            if organizer.cancelled:
                 self.notification_manager.show_notification(
-                    short_message,
-                    message_type="warning",
+                    f"Organização cancelada após {organizer.processed_files} arquivo(s). Organize novamente para continuar.",
+                    message_type="info",
                     duration=5000
                 )
-
-            directory = self.folder_path.get()
-            if not directory:
+            elif errors:
                 self.notification_manager.show_notification(
-                    "Selecione uma pasta para organizar!",
-                    message_type="error"
+                    f"Organização concluída com {len(errors)} erros. Verifique os logs.\n{organizer.stats.format_short(phases=2)}",
+                    message_type="warning",
+                    duration=5000
                 )
-                return
-
-            success, errors = organizer.organize_folder(directory)
-
-            if success:
-                if errors:
-                    for error in errors:
-                        short_message = "Erro ao mover arquivo"
-                        self.error_log.add_log(
-                            "File Error",
-                            short_message,
-                            error
-                        )
-                    
-                    self.notification_manager.show_notification(
-                        f"Organização concluída com {len(errors)} erros. Verifique os logs.",
-                        message_type="warning",
-                        duration=5000
-                    )
-                else:
-                    self.notification_manager.show_notification(
-                        "Pasta organizada com sucesso!",
-                        message_type="success"
-                    )
             else:
-                short_message = "Falha na organização"
-                
-                self.error_log.add_log(
-                    "Critical Error",
-                    short_message,
-                    errors
-                )
-                
                 self.notification_manager.show_notification(
-                    f"{short_message}. Verifique os logs.",
-                    message_type="error",
+                    f"Pasta organizada com sucesso!\n{organizer.stats.format_short(phases=2)}",
+                    message_type="success",
                     duration=5000
                 )
-                
-        except Exception as e:
-            short_message = "Erro inesperado"
+        else:
+            short_message = "Falha na organização"
+            
             self.error_log.add_log(
-                "Unexpected Error",
+                "Critical Error",
                 short_message,
-                str(e)
+                errors
             )
+            
             self.notification_manager.show_notification(
                 f"{short_message}. Verifique os logs.",
                 message_type="error",
                 duration=5000
             )
     
+    def preview_folder(self) -> None:
+        """
+        Shows which files would be moved, without moving them.
+
+        This method is called when the preview button is clicked. Like
+        organize_folder, it plans the selected directory on a background thread, with
+        the progress frame shown; the plans are streamed and only the number of files
+        for each destination folder is kept, so memory stays bounded.
+        """
+        directory = self.folder_path.get()
+        if not directory:
+            self.notification_manager.show_notification(
+                "Selecione uma pasta para pré-visualizar!",
+                message_type="error"
+            )
+            return
+
+        organizer = FileOrganizer()
+        self.organizer = organizer
+        self.progress_queue = queue.SimpleQueue()
+
+        self.place_forget()
+        self.progress_frame.start(self.cancel_organization)
+        self.progress_frame.place(relx=0.5, rely=0.62, relwidth=0.8, anchor="n")
+
+        self.worker = threading.Thread(target=self.run_preview, args=(organizer, directory), daemon=True)
+        self.worker.start()
+        self.after(PROGRESS_POLL_INTERVAL, self.poll_progress)
+
+    def run_preview(self, organizer: FileOrganizer, directory: str) -> None:
+        """
+        Counts the files planned for each destination folder. Called on the background
+        thread, so it never touches the widgets: the counts are put on the progress queue.
+
+        Args:
+            organizer (FileOrganizer): The organizer used to classify the files.
+            directory (str): The directory to be previewed.
+        """
+        try:
+            success, files = organizer.scan_folder(directory)
+            if not success:
+                self.progress_queue.put(("preview", False, files))
+                return
+
+            summary = {}
+            planned = 0
+            for plan in organizer.iter_plans(Path(directory), files):
+                for file_type, count in plan.summary().items():
+                    summary[file_type] = summary.get(file_type, 0) + count
+                planned += len(plan)
+                self.progress_queue.put(("progress", planned, planned))
+                if organizer.cancelled:
+                    break
+            self.progress_queue.put(("preview", True, summary))
+        except Exception as e:
+            self.progress_queue.put(("exception", False, str(e)))
+
+    def finish_preview(self, success: bool, summary: str | dict[str, int]) -> None:
+        """
+        Restores the buttons and shows the number of files planned for each
+        destination folder.
+
+        Args:
+            success (bool): Whether the directory could be read.
+            summary (str | dict[str, int]): The number of files by file type, or an
+                error message.
+        """
+        organizer = self.organizer
+        self.organizer = None
+        self.progress_frame.place_forget()
+        self.place(relx=0.5, rely=0.59, relheight=0.36, anchor="n")
+
+        if not success:
+            self.notification_manager.show_notification(
+                summary,
+                message_type="error",
+                duration=5000
+            )
+            return
+
+        if organizer.cancelled:
+            self.notification_manager.show_notification(
+                "Pré-visualização cancelada.",
+                message_type="info"
+            )
+            return
+
+        if not summary:
+            messagebox.showinfo("Pré-visualização", "Nenhum arquivo para organizar.")
+            return
+
+        lines = [f"{file_type}: {count} arquivo(s)" for file_type, count in summary.items()]
+        lines.append(f"\nTotal: {sum(summary.values())} arquivo(s)")
+        messagebox.showinfo("Pré-visualização", "\n".join(lines))
+
     def app_config(self) -> None:
         self.parent.place_settings_interface()
     
@@ -448,6 +778,98 @@ class ButtonsFrame(ctk.CTkFrame):
         button.configure(text_color=TEXT_COLOR, fg_color=SECONDARY_COLOR)
 
 
+class ProgressFrame(ctk.CTkFrame):
+    """
+    A frame showing the progress of an organization, with a cancel button.
+
+    Attributes:
+        progress_bar (ctk.CTkProgressBar): Bar with the share of planned files processed.
+        status_label (ctk.CTkLabel): Label with the files processed, files/sec and ETA.
+        cancel_button (ctk.CTkButton): Button to cancel the organization.
+        started_at (float): Monotonic time when the organization started.
+
+    Methods:
+        start: Resets the frame for a new organization.
+        update_progress: Shows the number of files processed, the throughput and the ETA.
+        show_cancelling: Shows that the organization is stopping.
+    """
+    def __init__(self, parent: ctk.CTk, font: str):
+        """
+        Initializes the ProgressFrame.
+
+        Args:
+            parent (ctk.CTk): The parent window.
+            font (str): The font to be used for the cancel button.
+        """
+        super().__init__(master=parent, fg_color=BACKGROUND_COLOR)
+
+        self.progress_bar = ctk.CTkProgressBar(
+            master=self,
+            progress_color=CONTRAST_COLOR,
+            fg_color=TEXT_COLOR,
+            height=12
+        )
+        self.progress_bar.pack(fill="x", pady=(10, 5))
+
+        self.status_label = ctk.CTkLabel(
+            master=self,
+            text="",
+            font=("Dubai", 14),
+            text_color=SECONDARY_COLOR
+        )
+        self.status_label.pack(pady=5)
+
+        self.cancel_button = ctk.CTkButton(
+            master=self,
+            text="Cancelar",
+            font=(font, 16, "bold"),
+            text_color=TEXT_COLOR,
+            width=140,
+            height=40,
+            fg_color=SECONDARY_COLOR,
+            hover_color=CONTRAST_COLOR,
+            corner_radius=10
+        )
+        self.cancel_button.pack(pady=10)
+
+        self.started_at = 0.0
+
+    def start(self, on_cancel: Callable[[], None]) -> None:
+        """
+        Resets the frame for a new organization.
+
+        Args:
+            on_cancel (Callable[[], None]): Called when the cancel button is clicked.
+        """
+        self.started_at = time.monotonic()
+        self.progress_bar.set(0)
+        self.status_label.configure(text="Lendo a pasta...")
+        self.cancel_button.configure(state="normal", text="Cancelar", command=on_cancel)
+
+    def update_progress(self, processed: int, planned: int) -> None:
+        """
+        Shows the number of files processed, the throughput and the ETA.
+
+        Args:
+            processed (int): Number of files processed so far.
+            planned (int): Number of files planned so far.
+        """
+        elapsed = time.monotonic() - self.started_at
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        text = f"{processed}/{planned} arquivos · {rate:.0f} arquivos/s"
+        if rate and processed < planned:
+            text += f" · restam ~{(planned - processed) / rate:.0f}s"
+
+        self.progress_bar.set(processed / planned if planned else 0)
+        self.status_label.configure(text=text)
+
+    def show_cancelling(self) -> None:
+        """
+        Shows that the organization is stopping, and disables the cancel button.
+        """
+        self.cancel_button.configure(state="disabled", text="Cancelando...")
+
+
 class Notification(ctk.CTkFrame):
     """
     A custom frame for displaying notifications.
@@ -617,6 +1039,7 @@ class CornerButtons:
         normal_image (ctk.CTkImage): The default image for the log button.
         hover_image (ctk.CTkImage): The hover state image for the log button.
         log_label (ctk.CTkLabel): The label acting as the log button.
+        log_window (LogWindow | None): The log window, built on first use.
 
     Methods:
         show_logs: Opens the log window to display error logs.
@@ -631,18 +1054,11 @@ class CornerButtons:
         """
         self.parent = parent
         self.error_log = error_log
+        self.log_window = None
 
-        self.normal_image = ctk.CTkImage(
-            light_image=Image.open(ERROR_ICON),
-            dark_image=Image.open(ERROR_ICON),
-            size=(16, 16)
-        )
+        self.normal_image = load_image(ERROR_ICON, (16, 16))
         
-        self.hover_image = ctk.CTkImage(
-            light_image=Image.open(ERROR_ICON_HOVER),
-            dark_image=Image.open(ERROR_ICON_HOVER),
-            size=(16, 16)
-        )
+        self.hover_image = load_image(ERROR_ICON_HOVER, (16, 16))
         
         self.log_label = ctk.CTkLabel(
             master=self.parent,
@@ -661,9 +1077,12 @@ class CornerButtons:
         Opens the log window to display error logs.
 
         This method is called when the log button is clicked. It creates a new
-        LogWindow instance to display the current error logs.
+        LogWindow on first use, and shows the same window again afterwards.
         """
-        LogWindow(self.parent, self.error_log)
+        if self.log_window is None or not self.log_window.winfo_exists():
+            self.log_window = LogWindow(self.parent, self.error_log)
+        else:
+            self.log_window.show()
 
 
 if __name__ == "__main__":
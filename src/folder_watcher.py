@@ -0,0 +1,267 @@
+from pathlib import Path
+from threading import Event
+from typing import Callable
+import ctypes
+import ctypes.util
+import os
+import select
+import stat
+import struct
+import sys
+import time
+from error_records import ErrorSummary
+from folder_organizer import FileOrganizer
+from move_journal import MoveJournal, JOURNAL_FILE_NAME
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_ISDIR = 0x40000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+
+EVENT_HEADER = struct.Struct("iIII")
+READ_SIZE = 64 * 1024
+
+POLL_INTERVAL = 1.0
+SETTLE_TIME = 2.0
+
+
+class InotifyEventSource:
+    """
+    Reports new files in a directory using Linux inotify.
+
+    Only the names carried by the events are returned, so the cost of each call
+    depends on the number of events and not on the size of the directory. If the
+    kernel event queue overflows, the directory is scanned once to recover.
+
+    Attributes:
+        directory (Path): The watched directory.
+
+    Methods:
+        wait: Wait for events and return the names of the files that changed.
+        close: Stop watching the directory.
+    """
+
+    def __init__(self, directory: Path):
+        """
+        Initializes the inotify instance and the watch on the directory.
+
+        Args:
+            directory (Path): The directory to be watched.
+
+        Raises:
+            OSError: If inotify is not available or the watch could not be added.
+        """
+        self.directory = directory
+
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("inotify indisponível nesta plataforma")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        try:
+            inotify_init1 = libc.inotify_init1
+            inotify_add_watch = libc.inotify_add_watch
+        except AttributeError:
+            raise OSError("inotify indisponível nesta plataforma")
+
+        self._fd = inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "Não foi possível iniciar o inotify")
+        if inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK) < 0:
+            error = ctypes.get_errno()
+            os.close(self._fd)
+            raise OSError(error, "Não foi possível observar o diretório", str(directory))
+
+    def wait(self, timeout: float) -> set[str]:
+        """
+        Wait for events and return the names of the files that changed.
+
+        Args:
+            timeout (float): Maximum time to wait, in seconds.
+
+        Returns:
+            set[str]: Names of the files created, written or moved into the directory.
+        """
+        names = set()
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return names
+
+        while True:
+            try:
+                data = os.read(self._fd, READ_SIZE)
+            except BlockingIOError:
+                break
+
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+                offset += EVENT_HEADER.size
+                if mask & IN_Q_OVERFLOW:
+                    names.update(entry.name for entry in os.scandir(self.directory))
+                elif length and not mask & IN_ISDIR:
+                    names.add(os.fsdecode(data[offset:offset + length].rstrip(b"\0")))
+                offset += length
+        return names
+
+    def close(self) -> None:
+        """
+        Stop watching the directory.
+        """
+        os.close(self._fd)
+
+
+class PollingEventSource:
+    """
+    Reports new files in a directory by scanning it periodically.
+
+    Used where inotify is not available. Each call scans the whole directory, so this
+    fallback costs one directory scan per interval.
+
+    Attributes:
+        directory (Path): The watched directory.
+        known_names (set[str]): Names present in the directory at the last scan.
+
+    Methods:
+        wait: Wait for the interval and return the names that appeared since the last scan.
+        close: Stop watching the directory.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.known_names = self._scan()
+
+    def _scan(self) -> set[str]:
+        with os.scandir(self.directory) as entries:
+            return {entry.name for entry in entries}
+
+    def wait(self, timeout: float) -> set[str]:
+        """
+        Wait for the interval and return the names that appeared since the last scan.
+
+        Args:
+            timeout (float): Time to wait before scanning, in seconds.
+
+        Returns:
+            set[str]: Names of the new entries of the directory.
+        """
+        time.sleep(timeout)
+        names = self._scan()
+        new_names = names - self.known_names
+        self.known_names = names
+        return new_names
+
+    def close(self) -> None:
+        """
+        Stop watching the directory.
+        """
+        self.known_names = set()
+
+
+def create_event_source(directory: Path) -> InotifyEventSource | PollingEventSource:
+    """
+    Create the best event source available for the directory.
+
+    Args:
+        directory (Path): The directory to be watched.
+
+    Returns:
+        InotifyEventSource | PollingEventSource: An inotify source on Linux, or a
+            polling source on other platforms and when inotify can't be used.
+    """
+    if sys.platform.startswith("linux"):
+        try:
+            return InotifyEventSource(directory)
+        except OSError:
+            pass
+    return PollingEventSource(directory)
+
+
+class FolderWatcher:
+    """
+    Keeps a directory organized, moving new files as they arrive.
+
+    Events are debounced: a new file is only moved after its size and modification
+    time have stayed the same for settle_time seconds, so files still being written
+    or downloaded are left alone. Destination indexes and the move journal are kept
+    across cycles, so each cycle only costs work proportional to the new arrivals.
+
+    Attributes:
+        organizer (FileOrganizer): The organizer used to move the files.
+        directory (Path): The watched directory.
+        poll_interval (float): Maximum time between two cycles, in seconds.
+        settle_time (float): Time a file must stay unchanged before it is moved, in seconds.
+        stop_event (Event): Event that stops the watcher when set.
+
+    Methods:
+        run: Watch the directory until stop_event is set.
+        stop: Ask the watcher to stop.
+    """
+
+    def __init__(self, organizer: FileOrganizer, directory: str, poll_interval: float = POLL_INTERVAL, settle_time: float = SETTLE_TIME):
+        self.organizer = organizer
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self.settle_time = settle_time
+        self.stop_event = Event()
+
+    def run(self, on_organized: Callable[[list[str], ErrorSummary], None] | None = None) -> None:
+        """
+        Watch the directory until stop_event is set.
+
+        Moves are appended to the journal of the last organization of the directory,
+        so undoing reverts the initial organization and the watched files together.
+
+        Args:
+            on_organized (Callable[[list[str], ErrorSummary], None] | None, optional): Called
+                after each cycle that moved files, with the file names and the errors.
+                Defaults to None.
+        """
+        organizer = self.organizer
+        destination_indexes = {}
+        journal = MoveJournal(self.directory)
+        journal.open(append=True)
+
+        pending: dict[str, tuple[int, int, float]] = {}
+        event_source = create_event_source(self.directory)
+        try:
+            while not self.stop_event.is_set():
+                now = time.monotonic()
+                for name in event_source.wait(self.poll_interval):
+                    if name != JOURNAL_FILE_NAME and name not in pending:
+                        pending[name] = (-1, -1, now)
+
+                ready = self._collect_ready(pending, time.monotonic())
+                if ready:
+                    _, errors = organizer.organize_files(self.directory, ready, destination_indexes, journal)
+                    journal.sync()
+                    if on_organized:
+                        on_organized(ready, errors)
+        finally:
+            event_source.close()
+            journal.close()
+
+    def _collect_ready(self, pending: dict[str, tuple[int, int, float]], now: float) -> list[str]:
+        ready = []
+        for name, (size, mtime, changed_at) in list(pending.items()):
+            try:
+                file_stat = os.stat(os.path.join(self.directory, name))
+            except OSError:
+                del pending[name]
+                continue
+
+            if not stat.S_ISREG(file_stat.st_mode):
+                del pending[name]
+            elif (file_stat.st_size, file_stat.st_mtime_ns) != (size, mtime):
+                pending[name] = (file_stat.st_size, file_stat.st_mtime_ns, now)
+            elif now - changed_at >= self.settle_time:
+                ready.append(name)
+                del pending[name]
+        return ready
+
+    def stop(self) -> None:
+        """
+        Ask the watcher to stop; it returns at the end of the current cycle.
+        """
+        self.stop_event.set()
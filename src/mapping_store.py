@@ -0,0 +1,198 @@
+from typing import Iterable, Iterator
+
+
+class MappingStore:
+    """
+    An indexed, ordered collection of extension to file type mappings.
+
+    Mappings keep the order they were added in, which is the order they are shown and
+    saved in. A hash index from the lowercased extension to its position makes lookups
+    and duplicate checks constant time, and a reverse index lists the extensions of
+    each file type. Both indexes are kept consistent by every change; bulk changes
+    (delete and replace) rebuild them once, instead of once per mapping.
+
+    Attributes:
+        items (list[tuple[str, str]]): The (extension, file type) pairs, in order. Read only.
+
+    Methods:
+        get: Get the file type of an extension.
+        position: Get the position of an extension.
+        add: Add a new mapping at the end.
+        put: Set the file type of an extension, adding it if needed.
+        set_type: Set the file type of the mapping at a position.
+        delete: Remove the mappings at several positions.
+        replace: Replace all the mappings.
+        extensions_of: Get the extensions mapped to a file type.
+        file_types: Get the file types in use.
+        as_dict: Get the mappings as a dictionary with lowercased extensions.
+    """
+
+    def __init__(self, items: Iterable[tuple[str, str]] = ()):
+        self.items: list[tuple[str, str]] = []
+        self._positions: dict[str, int] = {}
+        self._by_type: dict[str, dict[str, None]] = {}
+        self.replace(items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        return iter(self.items)
+
+    def __getitem__(self, position: int) -> tuple[str, str]:
+        return self.items[position]
+
+    def __contains__(self, extension: str) -> bool:
+        return extension.lower() in self._positions
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MappingStore):
+            return NotImplemented
+        return self.items == other.items
+
+    def get(self, extension: str, default: str | None = None) -> str | None:
+        """
+        Get the file type of an extension, ignoring case.
+
+        Args:
+            extension (str): The extension, such as ".jpg", or "others".
+            default (str | None, optional): Returned when the extension isn't mapped.
+                Defaults to None.
+
+        Returns:
+            str | None: The file type, or default.
+        """
+        position = self._positions.get(extension.lower())
+        return default if position is None else self.items[position][1]
+
+    def position(self, extension: str) -> int | None:
+        """
+        Get the position of an extension, ignoring case.
+
+        Args:
+            extension (str): The extension.
+
+        Returns:
+            int | None: The position, counting from 0, or None if it isn't mapped.
+        """
+        return self._positions.get(extension.lower())
+
+    def add(self, extension: str, file_type: str) -> int:
+        """
+        Add a new mapping at the end.
+
+        Args:
+            extension (str): The extension, kept as typed but compared ignoring case.
+            file_type (str): The file type.
+
+        Returns:
+            int: The position of the new mapping.
+
+        Raises:
+            ValueError: If the extension already exists.
+        """
+        key = extension.lower()
+        if key in self._positions:
+            raise ValueError("Esta extensão já existe!")
+        position = len(self.items)
+        self.items.append((extension, file_type))
+        self._positions[key] = position
+        self._by_type.setdefault(file_type, {})[key] = None
+        return position
+
+    def put(self, extension: str, file_type: str) -> int:
+        """
+        Set the file type of an extension, adding it at the end if it isn't mapped.
+
+        Args:
+            extension (str): The extension.
+            file_type (str): The file type.
+
+        Returns:
+            int: The position of the mapping.
+        """
+        position = self._positions.get(extension.lower())
+        if position is None:
+            return self.add(extension, file_type)
+        self.set_type(position, file_type)
+        return position
+
+    def set_type(self, position: int, file_type: str) -> None:
+        """
+        Set the file type of the mapping at a position.
+
+        Args:
+            position (int): The position, counting from 0.
+            file_type (str): The new file type.
+        """
+        extension, old_type = self.items[position]
+        key = extension.lower()
+        self._remove_from_type(old_type, key)
+        self.items[position] = (extension, file_type)
+        self._by_type.setdefault(file_type, {})[key] = None
+
+    def delete(self, positions: Iterable[int]) -> None:
+        """
+        Remove the mappings at several positions, rebuilding the indexes once.
+
+        Args:
+            positions (Iterable[int]): The positions, counting from 0.
+        """
+        removed = set(positions)
+        if not removed:
+            return
+        for position in removed:
+            extension, file_type = self.items[position]
+            self._remove_from_type(file_type, extension.lower())
+        self.items = [item for position, item in enumerate(self.items) if position not in removed]
+        self._positions = {extension.lower(): position for position, (extension, _) in enumerate(self.items)}
+
+    def replace(self, items: Iterable[tuple[str, str]]) -> None:
+        """
+        Replace all the mappings. When an extension repeats, its first position is kept
+        with the last file type.
+
+        Args:
+            items (Iterable[tuple[str, str]]): The (extension, file type) pairs.
+        """
+        self.items = []
+        self._positions = {}
+        self._by_type = {}
+        for extension, file_type in items:
+            self.put(extension, file_type)
+
+    def extensions_of(self, file_type: str) -> list[str]:
+        """
+        Get the extensions mapped to a file type, in the order they were mapped to it.
+
+        Args:
+            file_type (str): The file type.
+
+        Returns:
+            list[str]: The extensions, as typed.
+        """
+        return [self.items[self._positions[key]][0] for key in self._by_type.get(file_type, ())]
+
+    def file_types(self) -> set[str]:
+        """
+        Get the file types in use, including the one of "others".
+
+        Returns:
+            set[str]: The file types.
+        """
+        return set(self._by_type)
+
+    def as_dict(self) -> dict[str, str]:
+        """
+        Get the mappings as a dictionary, with the extensions lowercased.
+
+        Returns:
+            dict[str, str]: Dictionary mapping extensions to file types, in order.
+        """
+        return {extension.lower(): file_type for extension, file_type in self.items}
+
+    def _remove_from_type(self, file_type: str, key: str) -> None:
+        extensions = self._by_type[file_type]
+        del extensions[key]
+        if not extensions:
+            del self._by_type[file_type]
@@ -0,0 +1,204 @@
+from pathlib import Path
+from threading import Lock
+import json
+import os
+from error_records import ErrorRecord, ErrorSummary, MAX_ERROR_SAMPLES, RESTORE
+from error_log import read_lines_backwards
+
+JOURNAL_FILE_NAME = ".categoriza_journal"
+JOURNAL_SYNC_INTERVAL = 1000
+
+MOVE_RECORD = "M"
+END_RECORD = "E"
+
+
+class MoveJournal:
+    """
+    An append-only journal of the moves made while organizing a directory.
+
+    The journal is stored inside the organized directory, one JSON array per line,
+    with paths relative to the directory. Records are buffered and the file is only
+    fsync'ed every JOURNAL_SYNC_INTERVAL moves and when the journal is closed, so a
+    crash can lose at most the last batch of records. A run that finishes writes an
+    end record; a journal without it belongs to an interrupted run, which the next
+    run resumes by appending to the same journal.
+
+    Attributes:
+        directory (Path): The directory being organized.
+        path (Path): Path of the journal file.
+        sync_interval (int): Number of moves between two fsync calls.
+
+    Methods:
+        read: Read the moves recorded in the journal.
+        open: Start the journal for a new run, resume an interrupted one, or append to the last one.
+        record: Record a completed move.
+        sync: Write the buffered records to disk.
+        close: Flush and close the journal.
+        undo: Revert the moves recorded in the journal.
+    """
+
+    def __init__(self, directory: Path, sync_interval: int = JOURNAL_SYNC_INTERVAL):
+        self.directory = directory
+        self.path = directory / JOURNAL_FILE_NAME
+        self.sync_interval = sync_interval
+        self._prefix_length = len(os.path.join(directory, ""))
+        self._file = None
+        self._resuming = False
+        self._pending_records = 0
+        self._lock = Lock()
+
+    def read(self) -> tuple[list[tuple[str, str]], bool]:
+        """
+        Read the moves recorded in the journal.
+
+        Lines that can't be decoded (such as a line cut short by a crash) are ignored.
+
+        Returns:
+            tuple[list[tuple[str, str]], bool]: A tuple containing:
+                - The recorded moves as (source, destination) relative paths, in order.
+                - A boolean indicating whether the run finished.
+        """
+        moves = []
+        finished = False
+        try:
+            with open(self.path, "r", encoding="utf-8") as journal_file:
+                for line in journal_file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if record[0] == MOVE_RECORD:
+                        moves.append((record[1], record[2]))
+                        finished = False
+                    elif record[0] == END_RECORD:
+                        finished = True
+        except FileNotFoundError:
+            pass
+        return moves, finished
+
+    def open(self, append: bool = False) -> None:
+        """
+        Start the journal for a new run, or resume an interrupted one.
+
+        Only the last record is read, from the end of the file, to tell whether the
+        last run was interrupted, so opening costs the same for any journal size.
+
+        The file itself is only created when the first move is recorded, so runs that
+        move nothing don't replace the journal of the previous run. Files moved by an
+        interrupted run are no longer at their source, so nothing needs to be skipped:
+        the new moves are appended after them.
+
+        Args:
+            append (bool, optional): Whether the moves are appended even when the last
+                run finished, so one undo reverts both; used by watch mode to continue
+                the journal of its initial organization. Defaults to False.
+        """
+        self._resuming = append or self._is_interrupted()
+
+    def _is_interrupted(self) -> bool:
+        for line in read_lines_backwards(self.path):
+            try:
+                return json.loads(line)[0] == MOVE_RECORD
+            except (ValueError, IndexError):
+                continue
+        return False
+
+    def record(self, source: str, destination: str) -> None:
+        """
+        Record a completed move.
+
+        Args:
+            source (str): Full path the file was moved from.
+            destination (str): Full path the file was moved to.
+        """
+        line = json.dumps([MOVE_RECORD, source[self._prefix_length:], destination[self._prefix_length:]], ensure_ascii=False)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "a" if self._resuming else "w", encoding="utf-8")
+            self._file.write(line + "\n")
+            self._pending_records += 1
+            if self._pending_records >= self.sync_interval:
+                self._sync()
+
+    def sync(self) -> None:
+        """
+        Write the buffered records to disk, without closing the journal.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._sync()
+
+    def close(self, finished: bool = True) -> None:
+        """
+        Flush and close the journal.
+
+        Args:
+            finished (bool, optional): Whether the run finished; an interrupted run is
+                resumed by the next one. Defaults to True.
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            if finished:
+                self._file.write(json.dumps([END_RECORD]) + "\n")
+            self._sync()
+            self._file.close()
+            self._file = None
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending_records = 0
+
+    def undo(self, file_mover, max_error_samples: int = MAX_ERROR_SAMPLES) -> tuple[bool, str | ErrorSummary]:
+        """
+        Revert the moves recorded in the journal, from the last to the first.
+
+        A file is never restored over an existing one. When everything is restored the
+        journal is deleted and the folders left empty are removed; otherwise the journal
+        is rewritten with only the moves that could not be reverted.
+
+        Args:
+            file_mover (FileMover): The mover used to put the files back.
+            max_error_samples (int, optional): Maximum number of detailed error records
+                kept. Defaults to MAX_ERROR_SAMPLES.
+
+        Returns:
+            tuple[bool, str | ErrorSummary]: A tuple containing:
+                - A boolean indicating the success of the operation.
+                - A single error message, or the errors of the restoration.
+        """
+        moves, _ = self.read()
+        if not moves:
+            return False, "Nenhuma organização registrada para desfazer nesta pasta."
+
+        errors = ErrorSummary(max_error_samples)
+        failed_moves = []
+        folders = set()
+        for source, destination in reversed(moves):
+            source_path = os.path.join(self.directory, source)
+            destination_path = os.path.join(self.directory, destination)
+            try:
+                if os.path.lexists(source_path):
+                    raise FileExistsError(f"Já existe um arquivo em {source_path}")
+                file_mover.move(destination_path, source_path)
+                folders.add(os.path.dirname(destination_path))
+            except Exception as e:
+                errors.add(ErrorRecord.from_exception(RESTORE, destination_path, e))
+                failed_moves.append((source, destination))
+
+        for folder in folders:
+            try:
+                os.rmdir(folder)
+            except OSError:
+                pass
+
+        if failed_moves:
+            with open(self.path, "w", encoding="utf-8") as journal_file:
+                for source, destination in reversed(failed_moves):
+                    journal_file.write(json.dumps([MOVE_RECORD, source, destination], ensure_ascii=False) + "\n")
+                journal_file.write(json.dumps([END_RECORD]) + "\n")
+        else:
+            self.path.unlink(missing_ok=True)
+
+        return True, errors
@@ -0,0 +1,261 @@
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+import csv
+import fnmatch
+import os
+import re
+import time
+
+RULES_PATH = Path(__file__).parent.parent / "rules.csv"
+RULE_FIELDNAME = "Rule"
+VALUE_FIELDNAME = "Value"
+FILE_TYPE_FIELDNAME = "File Type"
+
+SIZE_OVER = "size_over"
+SIZE_UNDER = "size_under"
+OLDER_THAN = "older_than"
+NEWER_THAN = "newer_than"
+NAME_MATCHES = "name_matches"
+RULE_KINDS = (SIZE_OVER, SIZE_UNDER, OLDER_THAN, NEWER_THAN, NAME_MATCHES)
+
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+SECONDS_PER_DAY = 86400
+NO_MATCH = float("inf")
+
+
+class ThresholdIndex:
+    """
+    An index over numeric rules of the same kind, answering which one matches first.
+
+    The thresholds are sorted once, with the lowest rule position precomputed for every
+    prefix (rules matching values above their threshold) or suffix (rules matching
+    values below it). A lookup is a single bisect, whatever the number of rules.
+
+    Attributes:
+        thresholds (list[float]): The sorted thresholds.
+        above (bool): True if a rule matches values greater than its threshold.
+        best_positions (list[float]): Lowest rule position for each bisect result.
+
+    Methods:
+        match: Get the position of the first rule matching a value.
+    """
+
+    def __init__(self, rules: list[tuple[float, int]], above: bool):
+        """
+        Initializes the index.
+
+        Args:
+            rules (list[tuple[float, int]]): (threshold, rule position) pairs.
+            above (bool): True if a rule matches values greater than its threshold,
+                False if it matches values lower than it.
+        """
+        rules = sorted(rules)
+        self.thresholds = [threshold for threshold, _ in rules]
+        self.above = above
+        self.best_positions = [NO_MATCH] * (len(rules) + 1)
+
+        if above:
+            for i, (_, position) in enumerate(rules):
+                self.best_positions[i + 1] = min(self.best_positions[i], position)
+        else:
+            for i in range(len(rules) - 1, -1, -1):
+                self.best_positions[i] = min(self.best_positions[i + 1], rules[i][1])
+
+    def match(self, value: float) -> float:
+        """
+        Get the position of the first rule matching a value.
+
+        Args:
+            value (float): The value to be tested.
+
+        Returns:
+            float: The lowest matching rule position, or NO_MATCH.
+        """
+        if self.above:
+            return self.best_positions[bisect_left(self.thresholds, value)]
+        return self.best_positions[bisect_right(self.thresholds, value)]
+
+
+class RuleEngine:
+    """
+    Routes files to a file type by size, age or name, before the extension mapping.
+
+    Rules are read from rules.csv (columns "Rule", "Value" and "File Type") and the
+    first rule, in file order, that matches a file decides its type. All rules are
+    compiled once: name patterns are merged into a single case-insensitive regular
+    expression, and numeric rules into ThresholdIndex instances, so the cost per file
+    stays constant as the number of rules grows. Size and age rules use the stat data
+    returned by the scan.
+
+    Supported rules:
+        size_over / size_under: Size in bytes, or with a unit (KB, MB, GB, TB).
+        older_than / newer_than: Age in days, based on the modification time.
+        name_matches: A name pattern with * and ? wildcards (such as invoice_*).
+
+    Attributes:
+        file_types (list[str]): File type of each rule, by position.
+        needs_stat (bool): Whether any rule uses size or age.
+        name_pattern (re.Pattern | None): The merged name patterns.
+        size_over, size_under, older_than, newer_than (ThresholdIndex | None): The
+            compiled numeric rules of each kind.
+
+    Methods:
+        from_csv: Load and compile the rules from a CSV file.
+        match: Get the file type of the first rule matching a file.
+    """
+
+    def __init__(self, rules: list[tuple[str, str, str]], now: float | None = None):
+        """
+        Compiles the rules.
+
+        Args:
+            rules (list[tuple[str, str, str]]): (rule, value, file type) tuples, in priority order.
+            now (float | None, optional): Reference time for age rules. Defaults to the current time.
+
+        Raises:
+            ValueError: If a rule or value is invalid.
+        """
+        if now is None:
+            now = time.time()
+
+        self.file_types: list[str] = []
+        numeric_rules = {kind: [] for kind in RULE_KINDS}
+        name_patterns = []
+
+        for position, (kind, value, file_type) in enumerate(rules):
+            kind = kind.strip().lower()
+            value = value.strip()
+            self.file_types.append(file_type.strip())
+
+            if kind in (SIZE_OVER, SIZE_UNDER):
+                numeric_rules[kind].append((parse_size(value), position))
+            elif kind in (OLDER_THAN, NEWER_THAN):
+                numeric_rules[kind].append((now - parse_days(value) * SECONDS_PER_DAY, position))
+            elif kind == NAME_MATCHES:
+                name_patterns.append(f"(?P<r{position}>{glob_to_regex(value)})")
+            else:
+                raise ValueError(f"Regra desconhecida: {kind}")
+
+        self.name_pattern = re.compile("|".join(name_patterns), re.IGNORECASE | re.DOTALL) if name_patterns else None
+        self.size_over = ThresholdIndex(numeric_rules[SIZE_OVER], above=True) if numeric_rules[SIZE_OVER] else None
+        self.size_under = ThresholdIndex(numeric_rules[SIZE_UNDER], above=False) if numeric_rules[SIZE_UNDER] else None
+        # older than N days: modified before the cutoff; newer than N days: after it
+        self.older_than = ThresholdIndex(numeric_rules[OLDER_THAN], above=False) if numeric_rules[OLDER_THAN] else None
+        self.newer_than = ThresholdIndex(numeric_rules[NEWER_THAN], above=True) if numeric_rules[NEWER_THAN] else None
+        self.needs_stat = any((self.size_over, self.size_under, self.older_than, self.newer_than))
+
+    def __bool__(self) -> bool:
+        return bool(self.file_types)
+
+    @classmethod
+    def from_csv(cls, rules_path: Path = RULES_PATH) -> tuple["RuleEngine", str | None]:
+        """
+        Load and compile the rules from a CSV file. A missing file means no rules.
+
+        Args:
+            rules_path (Path, optional): Path of the rules file. Defaults to RULES_PATH.
+
+        Returns:
+            tuple[RuleEngine, str | None]: A tuple containing:
+                - RuleEngine: The compiled rules (empty if the file is missing or invalid).
+                - str | None: Error message if any, None otherwise.
+        """
+        try:
+            with open(rules_path, "r", newline="", encoding="utf-8") as csv_file:
+                reader = csv.DictReader(csv_file)
+                rules = [
+                    (row[RULE_FIELDNAME], row[VALUE_FIELDNAME], row[FILE_TYPE_FIELDNAME])
+                    for row in reader
+                    if row[RULE_FIELDNAME] and row[FILE_TYPE_FIELDNAME]
+                ]
+            return cls(rules), None
+        except FileNotFoundError:
+            return cls([]), None
+        except Exception as e:
+            return cls([]), f"Erro no arquivo de regras ({rules_path.name}): {e}. As regras foram ignoradas."
+
+    def match(self, file_name: str, file_stat: os.stat_result | None = None) -> str | None:
+        """
+        Get the file type of the first rule matching a file.
+
+        Args:
+            file_name (str): The name of the file.
+            file_stat (os.stat_result | None, optional): The stat of the file, required
+                by size and age rules. Defaults to None.
+
+        Returns:
+            str | None: The file type, or None if no rule matches.
+        """
+        best = NO_MATCH
+
+        if self.name_pattern is not None:
+            name_match = self.name_pattern.fullmatch(file_name)
+            if name_match:
+                best = int(name_match.lastgroup[1:])
+
+        if file_stat is not None:
+            if self.size_over:
+                best = min(best, self.size_over.match(file_stat.st_size))
+            if self.size_under:
+                best = min(best, self.size_under.match(file_stat.st_size))
+            if self.older_than:
+                best = min(best, self.older_than.match(file_stat.st_mtime))
+            if self.newer_than:
+                best = min(best, self.newer_than.match(file_stat.st_mtime))
+
+        if best == NO_MATCH:
+            return None
+        return self.file_types[best]
+
+
+def parse_size(value: str) -> float:
+    """
+    Parse a size such as "1GB", "500 MB" or "2048".
+
+    Args:
+        value (str): The size.
+
+    Returns:
+        float: The size in bytes.
+
+    Raises:
+        ValueError: If the size is invalid.
+    """
+    size_match = re.fullmatch(r"\s*(\d+(?:[.,]\d+)?)\s*([KMGT]?)B?\s*", value, re.IGNORECASE)
+    if not size_match:
+        raise ValueError(f"Tamanho inválido: {value}")
+    number, unit = size_match.groups()
+    return float(number.replace(",", ".")) * SIZE_UNITS[unit.upper()]
+
+
+def parse_days(value: str) -> float:
+    """
+    Parse an age in days, such as "90" or "90d".
+
+    Args:
+        value (str): The age.
+
+    Returns:
+        float: The number of days.
+
+    Raises:
+        ValueError: If the age is invalid.
+    """
+    days_match = re.fullmatch(r"\s*(\d+(?:[.,]\d+)?)\s*d?\s*", value, re.IGNORECASE)
+    if not days_match:
+        raise ValueError(f"Idade inválida: {value}")
+    return float(days_match.group(1).replace(",", "."))
+
+
+def glob_to_regex(pattern: str) -> str:
+    """
+    Convert a name pattern with wildcards into a regular expression without anchors.
+
+    Args:
+        pattern (str): The pattern, such as "invoice_*".
+
+    Returns:
+        str: The equivalent regular expression.
+    """
+    regex = fnmatch.translate(pattern)
+    return re.sub(r"\\[Zz]$", "", regex)
@@ -0,0 +1,153 @@
+from threading import Lock
+from time import perf_counter
+from typing import Iterable, Iterator
+
+SCAN = "scan"
+CLASSIFY = "classify"
+MKDIR = "mkdir"
+INDEX = "index"
+RESERVE = "reserve"
+RENAME = "rename"
+JOURNAL = "journal"
+TOTAL = "total"
+
+PHASE_LABELS = {
+    SCAN: "Varredura",
+    CLASSIFY: "Classificação",
+    MKDIR: "Criação de pastas",
+    INDEX: "Índice de destino",
+    RESERVE: "Reserva de nomes",
+    RENAME: "Movimentação",
+    JOURNAL: "Journal",
+}
+
+FILES = "files"
+MOVED = "moved"
+COLLISIONS = "collisions"
+RETRIES = "retries"
+ERRORS = "errors"
+
+COUNTER_LABELS = {
+    FILES: "Arquivos",
+    MOVED: "Movidos",
+    COLLISIONS: "Colisões de nome",
+    RETRIES: "Novas tentativas",
+    ERRORS: "Erros",
+}
+
+
+class RunStats:
+    """
+    Time and counters of each phase of an organization run.
+
+    The organizer only measures anything when it holds a RunStats instance; with
+    none, each instrumented point costs a single None check. With more than one
+    worker, phase times are summed across the threads, so they can add up to more
+    than the total time.
+
+    Attributes:
+        seconds (dict[str, float]): Time spent in each phase.
+        calls (dict[str, int]): Number of measurements of each phase.
+        counters (dict[str, int]): Event counters, such as moved files and collisions.
+
+    Methods:
+        add: Add the time of one measurement of a phase.
+        count: Increment a counter.
+        timed_iter: Wrap an iterator, adding the time spent producing each item to a phase.
+        format_table: Format the full breakdown as a table.
+        format_short: Format the main phases in a single line.
+    """
+
+    def __init__(self):
+        self.seconds: dict[str, float] = {}
+        self.calls: dict[str, int] = {}
+        self.counters: dict[str, int] = {}
+        self._lock = Lock()
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Add the time of one measurement of a phase.
+
+        Args:
+            phase (str): The phase, such as RENAME.
+            seconds (float): The time measured.
+        """
+        with self._lock:
+            self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+            self.calls[phase] = self.calls.get(phase, 0) + 1
+
+    def count(self, counter: str, amount: int = 1) -> None:
+        """
+        Increment a counter.
+
+        Args:
+            counter (str): The counter, such as COLLISIONS.
+            amount (int, optional): The increment. Defaults to 1.
+        """
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def timed_iter(self, phase: str, items: Iterable) -> Iterator:
+        """
+        Wrap an iterator, adding the time spent producing each item to a phase.
+
+        Used for the directory scan, which is lazy and interleaved with the other phases.
+
+        Args:
+            phase (str): The phase.
+            items (Iterable): The items to be wrapped.
+
+        Returns:
+            Iterator: The same items.
+        """
+        iterator = iter(items)
+        seconds = 0.0
+        try:
+            while True:
+                started = perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    seconds += perf_counter() - started
+                    return
+                seconds += perf_counter() - started
+                yield item
+        finally:
+            self.add(phase, seconds)
+
+    def format_table(self) -> str:
+        """
+        Format the full breakdown as a table, with the share of each phase in the total.
+
+        Returns:
+            str: The table.
+        """
+        total = self.seconds.get(TOTAL) or sum(self.seconds.values()) or 1.0
+        lines = [f"{'Fase':<20} {'Tempo (s)':>10} {'%':>6} {'Chamadas':>10}"]
+        for phase, label in PHASE_LABELS.items():
+            if phase in self.seconds:
+                seconds = self.seconds[phase]
+                lines.append(f"{label:<20} {seconds:>10.3f} {seconds / total * 100:>6.1f} {self.calls[phase]:>10}")
+        if TOTAL in self.seconds:
+            lines.append(f"{'Total':<20} {self.seconds[TOTAL]:>10.3f}")
+
+        for counter, label in COUNTER_LABELS.items():
+            if counter in self.counters:
+                lines.append(f"{label}: {self.counters[counter]}")
+        return "\n".join(lines)
+
+    def format_short(self, phases: int = 3) -> str:
+        """
+        Format the slowest phases and the total in a single line.
+
+        Args:
+            phases (int, optional): Number of phases shown. Defaults to 3.
+
+        Returns:
+            str: The summary, such as "Movimentação 1.20s · Varredura 0.31s · total 1.70s".
+        """
+        slowest = sorted((phase for phase in self.seconds if phase in PHASE_LABELS), key=self.seconds.get, reverse=True)
+        parts = [f"{PHASE_LABELS[phase]} {self.seconds[phase]:.2f}s" for phase in slowest[:phases]]
+        if TOTAL in self.seconds:
+            parts.append(f"total {self.seconds[TOTAL]:.2f}s")
+        return " · ".join(parts)